@@ -20,5 +20,13 @@ from .demes import (
     Merge,
     Admix,
 )
-from .load_dump import load_asdict, loads_asdict, load, loads, dump, dumps
+from .load_dump import (
+    load_asdict,
+    loads_asdict,
+    load,
+    loads,
+    load_many,
+    dump,
+    dumps,
+)
 from .ms import from_ms
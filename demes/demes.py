@@ -141,6 +141,41 @@ def check_allowed(data, allowed_fields, scope):
             )
 
 
+# Fields that may be specified in the dict representation of a graph,
+# as checked by Graph.fromdict().
+_ALLOWED_FIELDS_TOPLEVEL = [
+    "description",
+    "time_units",
+    "generation_time",
+    "defaults",
+    "doi",
+    "demes",
+    "migrations",
+    "pulses",
+]
+_ALLOWED_FIELDS_DEFAULTS = ["deme", "migration", "pulse", "epoch"]
+_ALLOWED_FIELDS_DEME = ["description", "start_time", "ancestors", "proportions"]
+_ALLOWED_FIELDS_DEME_INNER = _ALLOWED_FIELDS_DEME + ["name", "defaults", "epochs"]
+_ALLOWED_FIELDS_DEME_DEFAULTS = ["epoch"]
+_ALLOWED_FIELDS_MIGRATION = [
+    "demes",
+    "source",
+    "dest",
+    "start_time",
+    "end_time",
+    "rate",
+]
+_ALLOWED_FIELDS_PULSE = ["source", "dest", "time", "proportion"]
+_ALLOWED_FIELDS_EPOCH = [
+    "end_time",
+    "start_size",
+    "end_size",
+    "size_function",
+    "cloning_rate",
+    "selfing_rate",
+]
+
+
 def insert_defaults(data, defaults):
     for key, value in defaults.items():
         if key not in data:
@@ -1782,72 +1817,38 @@ class Graph:
         """
         Return a graph from a dict representation. The inverse of asdict().
         """
+        # Don't modify the input data dict.
+        return cls._fromdict(copy.deepcopy(data))
+
+    @classmethod
+    def _fromdict(cls, data: MutableMapping[str, Any]) -> "Graph":
+        """
+        Like fromdict(), but the input data dict is consumed in the process.
+        For callers that own the data and don't need it afterwards, such as
+        the loading functions, this avoids an unnecessary deep copy.
+        """
         if not isinstance(data, MutableMapping):
             raise TypeError("data is not a dictionary")
 
-        # Don't modify the input data dict.
-        data = copy.deepcopy(data)
-
-        check_allowed(
-            data,
-            [
-                "description",
-                "time_units",
-                "generation_time",
-                "defaults",
-                "doi",
-                "demes",
-                "migrations",
-                "pulses",
-            ],
-            "toplevel",
-        )
+        check_allowed(data, _ALLOWED_FIELDS_TOPLEVEL, "toplevel")
 
         defaults = pop_object(data, "defaults", {}, scope="toplevel")
-        check_allowed(
-            defaults,
-            ["deme", "migration", "pulse", "epoch"],
-            "defaults",
-        )
+        check_allowed(defaults, _ALLOWED_FIELDS_DEFAULTS, "defaults")
 
         deme_defaults = pop_object(defaults, "deme", {}, scope="defaults")
-        allowed_fields_deme = [
-            "description",
-            "start_time",
-            "ancestors",
-            "proportions",
-        ]
-        allowed_fields_deme_inner = allowed_fields_deme + ["name", "defaults", "epochs"]
-        check_allowed(deme_defaults, allowed_fields_deme, "defaults: deme")
+        check_allowed(deme_defaults, _ALLOWED_FIELDS_DEME, "defaults: deme")
 
         migration_defaults = pop_object(defaults, "migration", {}, scope="defaults")
-        allowed_fields_migration = [
-            "demes",
-            "source",
-            "dest",
-            "start_time",
-            "end_time",
-            "rate",
-        ]
         check_allowed(
-            migration_defaults, allowed_fields_migration, "defaults: migration"
+            migration_defaults, _ALLOWED_FIELDS_MIGRATION, "defaults: migration"
         )
 
         pulse_defaults = pop_object(defaults, "pulse", {}, scope="defaults")
-        allowed_fields_pulse = ["source", "dest", "time", "proportion"]
-        check_allowed(pulse_defaults, allowed_fields_pulse, "defaults.pulse")
+        check_allowed(pulse_defaults, _ALLOWED_FIELDS_PULSE, "defaults.pulse")
 
         # epoch defaults may also be specified within a Deme definition.
         global_epoch_defaults = pop_object(defaults, "epoch", {}, scope="defaults")
-        allowed_fields_epoch = [
-            "end_time",
-            "start_size",
-            "end_size",
-            "size_function",
-            "cloning_rate",
-            "selfing_rate",
-        ]
-        check_allowed(global_epoch_defaults, allowed_fields_epoch, "defaults: epoch")
+        check_allowed(global_epoch_defaults, _ALLOWED_FIELDS_EPOCH, "defaults: epoch")
 
         if "time_units" not in data:
             raise KeyError("toplevel: required field 'time_units' not found")
@@ -1866,7 +1867,7 @@ class Graph:
                 raise KeyError("demes[{i}]: required field 'name' not found")
             deme_name = deme_data.pop("name")
             check_allowed(
-                deme_data, allowed_fields_deme_inner, f"demes[{i}] {deme_name}"
+                deme_data, _ALLOWED_FIELDS_DEME_INNER, f"demes[{i}] {deme_name}"
             )
             insert_defaults(deme_data, deme_defaults)
 
@@ -1882,7 +1883,9 @@ class Graph:
                 deme_data, "defaults", {}, scope=f"demes[{i}] {deme.name}"
             )
             check_allowed(
-                local_defaults, ["epoch"], f"demes[{i}] {deme.name}: defaults"
+                local_defaults,
+                _ALLOWED_FIELDS_DEME_DEFAULTS,
+                f"demes[{i}] {deme.name}: defaults",
             )
             local_epoch_defaults = pop_object(
                 local_defaults, "epoch", {}, scope=f"demes[{i}] {deme.name}: defaults"
@@ -1892,7 +1895,7 @@ class Graph:
 
             check_allowed(
                 epoch_defaults,
-                allowed_fields_epoch,
+                _ALLOWED_FIELDS_EPOCH,
                 f"demes[{i}] {deme.name}: defaults: epoch",
             )
 
@@ -1915,7 +1918,7 @@ class Graph:
             for j, epoch_data in enumerate(epochs):
                 check_allowed(
                     epoch_data,
-                    allowed_fields_epoch,
+                    _ALLOWED_FIELDS_EPOCH,
                     f"demes[{i}] {deme.name}: epochs[{j}]",
                 )
                 insert_defaults(epoch_data, epoch_defaults)
@@ -1941,7 +1944,7 @@ class Graph:
                 data, "migrations", [], required_type=MutableMapping, scope="toplevel"
             )
         ):
-            check_allowed(migration_data, allowed_fields_migration, f"migration[{i}]")
+            check_allowed(migration_data, _ALLOWED_FIELDS_MIGRATION, f"migration[{i}]")
             insert_defaults(migration_data, migration_defaults)
             if "rate" not in migration_data:
                 raise KeyError(f"migration[{i}]: required field 'rate' not found")
@@ -1982,7 +1985,7 @@ class Graph:
         for i, pulse_data in enumerate(
             pop_list(data, "pulses", [], required_type=MutableMapping, scope="toplevel")
         ):
-            check_allowed(pulse_data, allowed_fields_pulse, f"pulse[{i}]")
+            check_allowed(pulse_data, _ALLOWED_FIELDS_PULSE, f"pulse[{i}]")
             insert_defaults(pulse_data, pulse_defaults)
             for field in ("source", "dest", "time", "proportion"):
                 if field not in pulse_data:
@@ -2004,11 +2007,16 @@ class Graph:
         Return a fully-resolved dict representation of the graph.
         """
 
+        # Epoch start times are implied by the deme start time and the
+        # preceding epoch's end time, so aren't part of the spec data model.
+        epoch_start_time = attr.fields(Epoch).start_time
+
         def filt(attrib, value):
             return (
                 value is not None
                 and not (hasattr(value, "__len__") and len(value) == 0)
                 and attrib.name != "_deme_map"
+                and attrib is not epoch_start_time
             )
 
         def coerce_numbers(inst, attribute, value):
@@ -2025,12 +2033,7 @@ class Graph:
                 value = float(value)
             return value
 
-        data = attr.asdict(self, filter=filt, value_serializer=coerce_numbers)
-        # translate to spec data model
-        for deme in data["demes"]:
-            for epoch in deme["epochs"]:
-                del epoch["start_time"]
-        return data
+        return attr.asdict(self, filter=filt, value_serializer=coerce_numbers)
 
     def asdict_simplified(self) -> MutableMapping[str, Any]:
         """
@@ -2039,11 +2042,11 @@ class Graph:
 
         def simplify_epochs(data):
             """
-            Remove epoch start times. Also remove deme start time
-            if implied by the deme ancestor(s)'s end time(s).
+            Remove epoch fields with default or implied values. Also remove
+            deme start time if implied by the deme ancestor(s)'s end time(s).
             """
             for deme in data["demes"]:
-                for j, epoch in enumerate(deme["epochs"]):
+                for epoch in deme["epochs"]:
                     if epoch["size_function"] in ("constant", "exponential"):
                         del epoch["size_function"]
                     if epoch["start_size"] == epoch["end_size"]:
@@ -2053,7 +2056,6 @@ class Graph:
                     if epoch["cloning_rate"] == 0:
                         del epoch["cloning_rate"]
 
-            for deme in data["demes"]:
                 # remove implied start times
                 if math.isinf(deme["start_time"]):
                     del deme["start_time"]
@@ -1,4 +1,5 @@
 import math
+import functools
 import itertools
 import collections
 import struct
@@ -32,13 +33,37 @@ FLOAT_MAX = prec32(1e30)
 FLOAT_EPS = prec32(1e-6)
 
 
+# Unicode categories of the characters allowed in Python identifiers.
+# See https://docs.python.org/3/reference/lexical_analysis.html#identifiers
+_ID_START_CATEGORIES = ("Lu", "Ll", "Lt", "Lm", "Lo", "Nl")
+_ID_CONTINUE_CATEGORIES = _ID_START_CATEGORIES + ("Mn", "Mc", "Nd", "Pc")
+
+
 @st.composite
 def deme_names(draw, max_length=20):
     """
     A hypothesis strategy for creating a valid deme name.
     """
-    name = draw(st.text(min_size=1, max_size=max_length))
-    # Names must be valid Python identifiers.
+    # Names must be valid Python identifiers. Only a tiny fraction of
+    # arbitrary text is a valid identifier, so rather than filtering
+    # st.text(), we build the name from the permitted character classes.
+    head = draw(
+        st.characters(
+            whitelist_categories=_ID_START_CATEGORIES, whitelist_characters="_"
+        )
+    )
+    tail = draw(
+        st.text(
+            alphabet=st.characters(
+                whitelist_categories=_ID_CONTINUE_CATEGORIES,
+                whitelist_characters="_",
+            ),
+            max_size=max_length - 1,
+        )
+    )
+    name = head + tail
+    # A few characters in these categories are nevertheless excluded
+    # (or are only valid after NFKC normalisation), so we still check.
     hyp.assume(name.isidentifier())
     return name
 
@@ -135,6 +160,11 @@ def epochs_lists(
     return epochs
 
 
+# Strategy objects are immutable, so those built for the same arguments can
+# be shared between examples rather than being constructed afresh each time.
+_cached_epochs_lists = functools.lru_cache(maxsize=256)(epochs_lists)
+
+
 @st.composite
 def migration_matrices(
     draw, graph, max_migrations=10, max_additional_migration_intervals=5
@@ -179,6 +209,8 @@ def migration_matrices(
 
     mm_list = [[[0] * n for _ in range(n)] for _ in range(len(end_times))]
     n_migrations = draw(st.integers(min_value=0, max_value=max_migrations))
+    if n_migrations == 0:
+        return mm_list, saved_start_time, end_times
 
     for migration_matrix, end_time in zip(mm_list, end_times):
         # Find demes alive in this interval.
@@ -255,8 +287,12 @@ def pulses_lists(draw, graph, max_pulses=10):
     A hypothesis strategy for creating a pulses list for a graph.
     """
     n_pulses = draw(st.integers(min_value=0, max_value=max_pulses))
-    pulses = []
-    ingress_proportions = collections.defaultdict(lambda: 0)
+    if n_pulses == 0:
+        return []
+
+    # Find the pairs of demes that coexist for some time, and the
+    # interval (time_lo, time_hi) in which they coexist.
+    pairs = []
     for j, deme_j in enumerate(graph.demes[:-1]):
         for deme_k in graph.demes[j + 1 :]:
             time_lo = max(deme_j.end_time, deme_k.end_time)
@@ -266,47 +302,55 @@ def pulses_lists(draw, graph, max_pulses=10):
             # interval (time_lo, time_hi) to ensure the pulse doesn't happen
             # at any deme's start_time or end_time, which could be invalid.
             # So we check for some breathing room between time_lo and time_hi.
-            if time_hi <= time_lo + FLOAT_EPS:
-                continue
-            n = draw(st.integers(min_value=0, max_value=n_pulses))
-            for _ in range(n):
-                source, dest = deme_j.name, deme_k.name
-                if draw(st.booleans()):
-                    source, dest = dest, source
-                time = draw(
-                    st.floats(
-                        min_value=time_lo,
-                        max_value=time_hi,
-                        exclude_min=True,
-                        exclude_max=True,
-                        width=32,
-                    )
-                )
-                max_proportion = 1 - ingress_proportions[(dest, time)]
-                if math.isclose(max_proportion, 0):
-                    continue
-                proportion = draw(
-                    st.floats(
-                        min_value=0,
-                        max_value=prec32(max_proportion),
-                        exclude_min=True,
-                        exclude_max=True,
-                        width=32,
-                    )
-                )
-                ingress_proportions[(dest, time)] += proportion
-                pulse = dict(
-                    source=source,
-                    dest=dest,
-                    time=time,
-                    proportion=proportion,
-                )
-                pulses.append(pulse)
-                n_pulses -= 1
-            if n_pulses == 0:
-                break
-        if n_pulses == 0:
-            break
+            if time_hi > time_lo + FLOAT_EPS:
+                pairs.append((deme_j.name, deme_k.name, time_lo, time_hi))
+
+    pulses = []
+    if len(pairs) == 0:
+        return pulses
+
+    # Draw the deme pairs, and the direction of each pulse, all at once.
+    choices = draw(
+        st.lists(
+            st.tuples(st.sampled_from(pairs), st.booleans()),
+            min_size=n_pulses,
+            max_size=n_pulses,
+        )
+    )
+
+    ingress_proportions = collections.defaultdict(lambda: 0)
+    for (source, dest, time_lo, time_hi), swap in choices:
+        if swap:
+            source, dest = dest, source
+        time = draw(
+            st.floats(
+                min_value=time_lo,
+                max_value=time_hi,
+                exclude_min=True,
+                exclude_max=True,
+                width=32,
+            )
+        )
+        max_proportion = 1 - ingress_proportions[(dest, time)]
+        if math.isclose(max_proportion, 0):
+            continue
+        proportion = draw(
+            st.floats(
+                min_value=0,
+                max_value=prec32(max_proportion),
+                exclude_min=True,
+                exclude_max=True,
+                width=32,
+            )
+        )
+        ingress_proportions[(dest, time)] += proportion
+        pulse = dict(
+            source=source,
+            dest=dest,
+            time=time,
+            proportion=proportion,
+        )
+        pulses.append(pulse)
     return pulses
 
 
@@ -351,11 +395,16 @@ def graphs(
         doi=draw(st.lists(yaml_strings(), max_size=3)),
     )
 
+    # The names, start times and end times of the demes added so far.
+    names = []
+    start_times = []
+    end_times = []
+
     for deme_name in draw(st.sets(deme_names(), min_size=1, max_size=max_demes)):
         ancestors = []
         proportions = []
         start_time = math.inf
-        n_demes = 0 if "demes" not in b.data else len(b.data["demes"])
+        n_demes = len(names)
         if n_demes > 0:
             # draw indices into demes list to use as ancestors
             anc_idx = draw(
@@ -366,12 +415,8 @@ def graphs(
                 )
             )
             if len(anc_idx) > 0:
-                time_hi = min(
-                    FLOAT_MAX, min(b.data["demes"][j]["start_time"] for j in anc_idx)
-                )
-                time_lo = max(
-                    b.data["demes"][j]["epochs"][-1]["end_time"] for j in anc_idx
-                )
+                time_hi = min(FLOAT_MAX, min(start_times[j] for j in anc_idx))
+                time_lo = max(end_times[j] for j in anc_idx)
                 # If time_hi > time_lo, the proposed ancestors exist
                 # at the same time. So we draw a number for the deme's
                 # start_time, which must be in the half-open interval
@@ -394,7 +439,7 @@ def graphs(
                             width=32,
                         )
                     )
-                    ancestors = [b.data["demes"][j]["name"] for j in anc_idx]
+                    ancestors = [names[j] for j in anc_idx]
                     if len(ancestors) == 1:
                         proportions = [1.0]
                     else:
@@ -407,21 +452,26 @@ def graphs(
                         )
                         psum = sum(proportions)
                         proportions = [p / psum for p in proportions]
+        description = draw(st.none() | yaml_strings())
+        epochs = draw(
+            _cached_epochs_lists(
+                start_time=start_time,
+                max_epochs=max_epochs,
+                min_deme_size=min_deme_size,
+                max_deme_size=max_deme_size,
+            )
+        )
         b.add_deme(
             name=deme_name,
-            description=draw(st.none() | yaml_strings()),
+            description=description,
             ancestors=ancestors,
             proportions=proportions,
-            epochs=draw(
-                epochs_lists(
-                    start_time=start_time,
-                    max_epochs=max_epochs,
-                    min_deme_size=min_deme_size,
-                    max_deme_size=max_deme_size,
-                )
-            ),
+            epochs=epochs,
             start_time=start_time,
         )
+        names.append(deme_name)
+        start_times.append(start_time)
+        end_times.append(epochs[-1]["end_time"])
 
     graph = b.resolve()
     graph.migrations = draw(migrations_lists(graph, max_migrations=max_migrations))
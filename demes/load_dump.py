@@ -1,26 +1,120 @@
 """
 Functions to load and dump graphs in YAML and JSON formats.
 """
-import contextlib
+import collections
+import functools
+import hashlib
 import json
 import io
+import math
+import os
+import stat
+import threading
+from typing import Any, Tuple
 
-import ruamel.yaml
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
 
 import demes
 
 
-@contextlib.contextmanager
-def _open_file_polymorph(polymorph, mode="r"):
+def _read_file(path):
     """
-    Open polymorph as a path and yield the fileobj. If that fails,
-    just yield polymorph under the assumption it's a fileobj.
+    Return the contents of the file at the given path, as bytes.
     """
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
     try:
-        with open(polymorph, mode) as f:
-            yield f
+        st = os.fstat(fd)
+        if hasattr(os, "posix_fadvise") and stat.S_ISREG(st.st_mode):
+            # We read the whole file from start to end, so ask the kernel
+            # for aggressive readahead. This fails with ESPIPE for pipes
+            # and FIFOs, which have no readahead anyway.
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        # For a regular file, the first read gets everything, and the
+        # second read confirms we're at the end. Other files (e.g. pipes)
+        # may report a size of zero, or need more reads.
+        size = st.st_size
+        chunks = []
+        while True:
+            chunk = os.read(fd, max(size, io.DEFAULT_BUFFER_SIZE))
+            if len(chunk) == 0:
+                break
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+    return b"".join(chunks)
+
+
+def _write_file(path, data):
+    """
+    Write the bytes in data to the file at the given path.
+    """
+    fd = os.open(
+        path,
+        os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0),
+        0o666,
+    )
+    try:
+        # A single write is usually enough, but it's not guaranteed.
+        view = memoryview(data)
+        while len(view) > 0:
+            n = os.write(fd, view)
+            view = view[n:]
+    finally:
+        os.close(fd)
+
+
+# Files with a .zst suffix are transparently (de)compressed with Zstandard.
+# Demes files compress very well, so for cold reads from slow (e.g. network)
+# filesystems, decompression is much cheaper than reading the extra bytes.
+# This requires the optional zstandard package, which is imported on demand.
+
+
+def _is_zstd_path(path):
+    return os.fsdecode(path).endswith(".zst")
+
+
+def _import_zstandard():
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ImportError(
+            "The zstandard package is required to load or dump .zst files."
+        ) from e
+    return zstandard
+
+
+def _zstd_decompress(buf):
+    zstandard = _import_zstandard()
+    # Unlike ZstdDecompressor.decompress(), a stream reader doesn't need the
+    # decompressed size to be recorded in the frame header. A file may also
+    # consist of several concatenated frames (e.g. from "zstd >> file"),
+    # which the zstd command line tool decompresses as a whole, so we do too.
+    dctx = zstandard.ZstdDecompressor()
+    with dctx.stream_reader(buf, read_across_frames=True) as reader:
+        return reader.read()
+
+
+def _zstd_compress(buf):
+    zstandard = _import_zstandard()
+    return zstandard.ZstdCompressor(level=3).compress(buf)
+
+
+def _read_polymorph(polymorph):
+    """
+    Read the contents of polymorph as a path. If it's not a path,
+    assume it's a fileobj and call its read() method.
+    """
+    try:
+        path = os.fspath(polymorph)
     except TypeError:
-        yield polymorph
+        return polymorph.read()
+    buf = _read_file(path)
+    if _is_zstd_path(path):
+        buf = _zstd_decompress(buf)
+    return buf
 
 
 # NOTE: The state of Python YAML libraries in 2020 leaves much to be desired.
@@ -30,16 +124,32 @@ def _open_file_polymorph(polymorph, mode="r"):
 # with additional features and desirable behaviour.
 # However, neither pyyaml nor ruamel gaurantee API stability, and neither
 # provide complete reference documentation for their APIs.
-# The YAML code in demes is limited to the following two functions,
+# The YAML code in demes is limited to the following functions,
 # which are hopefully simple enough to not suffer from API instability.
+#
+# With typ="safe", ruamel.yaml uses the libyaml-based C parser and emitter
+# from ruamel.yaml.clib when they're available, and otherwise falls back to
+# the (much slower) pure Python implementation. Scalars are still resolved
+# according to YAML v1.2 in either case.
+
+
+# Importing ruamel.yaml takes a sizeable fraction of the time needed to
+# import demes, so it's deferred until YAML is actually loaded or dumped.
 
 
 def _load_yaml_asdict(fp):
+    import ruamel.yaml
+
     with ruamel.yaml.YAML(typ="safe") as yaml:
         return yaml.load(fp)
 
 
 def _dump_yaml_fromdict(data, fp):
+    if _dump_yaml_fromdict_fast(data, fp):
+        return
+
+    import ruamel.yaml
+
     with ruamel.yaml.YAML(typ="safe", output=fp) as yaml:
         # Output flow style, but only for collections that consist only
         # of scalars (i.e. the leaves in the document tree).
@@ -49,23 +159,206 @@ def _dump_yaml_fromdict(data, fp):
         yaml.allow_unicode = False
         # Keep dict insertion order, thank you very much!
         yaml.sort_base_mapping_type_on_output = False
+        # The data is a tree of freshly created dicts and lists (from
+        # Graph.asdict()), so there's nothing to gain from anchors/aliases.
+        # Skip the per-node bookkeeping needed to detect repeated objects.
+        yaml.representer.ignore_aliases = lambda *args: True
         yaml.dump(data)
 
 
+class _UnsupportedType(Exception):
+    pass
+
+
+@functools.lru_cache(maxsize=None)
+def _yaml_resolver():
+    import ruamel.yaml.resolver
+
+    return ruamel.yaml.resolver.Resolver()
+
+
+def _dump_yaml_fromdict_fast(data, fp):
+    """
+    Dump data to fp by feeding events directly into libyaml's emitter.
+    Returns False, without writing anything, if this isn't possible.
+
+    The generic ruamel.yaml dumper spends nearly all its time in the Python
+    representer, building and tagging a node for every object. But our data
+    contains only dicts, lists, strings, ints and floats (from Graph.asdict()),
+    so we can produce the same events as the representer/serializer would,
+    with much less overhead. Formatting is still left to libyaml, so the
+    output is identical to that of the generic dumper.
+    """
+    try:
+        from ruamel.yaml.cyaml import CEmitter
+    except ImportError:  # pragma: no cover
+        return False
+    from ruamel.yaml.events import (
+        StreamStartEvent,
+        StreamEndEvent,
+        DocumentStartEvent,
+        DocumentEndEvent,
+        MappingStartEvent,
+        MappingEndEvent,
+        SequenceStartEvent,
+        SequenceEndEvent,
+        ScalarEvent,
+    )
+    from ruamel.yaml.nodes import ScalarNode
+
+    resolver = _yaml_resolver()
+    str_tag = "tag:yaml.org,2002:str"
+    events = []
+
+    def is_leaf(value):
+        return type(value) not in (dict, list)
+
+    def add_events(value):
+        if type(value) is dict:
+            # Flow style only for collections that consist only of scalars.
+            flow_style = all(is_leaf(v) for v in value.values())
+            events.append(MappingStartEvent(None, None, True, flow_style=flow_style))
+            for k, v in value.items():
+                add_events(k)
+                add_events(v)
+            events.append(MappingEndEvent())
+        elif type(value) is list:
+            flow_style = all(is_leaf(v) for v in value)
+            events.append(SequenceStartEvent(None, None, True, flow_style=flow_style))
+            for v in value:
+                add_events(v)
+            events.append(SequenceEndEvent())
+        elif type(value) is str:
+            # The string may be emitted without quotes only if it wouldn't
+            # be interpreted as some other type (e.g. "1.0", or "null").
+            plain = str(resolver.resolve(ScalarNode, value, (True, False))) == str_tag
+            events.append(ScalarEvent(None, None, (plain, True), value))
+        elif type(value) is int:
+            events.append(ScalarEvent(None, None, (True, False), str(value)))
+        elif type(value) is float:
+            # As for ruamel.yaml's SafeRepresenter.
+            if math.isnan(value):
+                string = ".nan"
+            elif math.isinf(value):
+                string = ".inf" if value > 0 else "-.inf"
+            else:
+                string = repr(value).lower()
+            events.append(ScalarEvent(None, None, (True, False), string))
+        else:
+            raise _UnsupportedType
+
+    try:
+        add_events(data)
+    except _UnsupportedType:
+        return False
+
+    emitter = CEmitter(fp, allow_unicode=False)
+    # The encoding determines whether libyaml writes bytes or str.
+    encoding = "utf-8" if _is_binary_fileobj(fp) else None
+    emitter.emit(StreamStartEvent(encoding=encoding))
+    emitter.emit(DocumentStartEvent(explicit=False))
+    for event in events:
+        emitter.emit(event)
+    emitter.emit(DocumentEndEvent(explicit=False))
+    emitter.emit(StreamEndEvent())
+    emitter.dispose()
+    return True
+
+
+def _has_nonfinite(data):
+    """
+    Return True if the nested data contains a non-finite float.
+    """
+    if isinstance(data, float):
+        return not math.isfinite(data)
+    elif isinstance(data, dict):
+        return any(_has_nonfinite(value) for value in data.values())
+    elif isinstance(data, list):
+        return any(_has_nonfinite(value) for value in data)
+    return False
+
+
+# The orjson library is much faster than the standard library's json module,
+# so we use it when it's available. However, orjson strictly follows the
+# JSON spec, which has no representation for infinity. The json module
+# uses the (non-standard) Infinity literal, which we need for infinite
+# start times, so we fall back to the json module for such documents.
+# We also fall back if orjson's output isn't pure ASCII, because orjson
+# can't escape non-ASCII characters, and the output may be written to a
+# text stream with any encoding. The json module is told to use the same
+# compact separators as orjson, so the style of the output doesn't depend
+# on which library produced it.
+
+
+def _load_json(string):
+    if orjson is not None:
+        try:
+            return orjson.loads(string)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(string)
+
+
+def _dumps_json(data):
+    """
+    Return the JSON encoding of data, as ASCII encoded bytes.
+    """
+    if orjson is not None and not _has_nonfinite(data):
+        try:
+            buf = orjson.dumps(data)
+        except orjson.JSONEncodeError:
+            pass
+        else:
+            if buf.isascii():
+                return buf
+    return json.dumps(data, separators=(",", ":")).encode("ascii")
+
+
+def _is_binary_fileobj(fileobj):
+    """
+    Return True if fileobj is a file-like object opened in binary mode.
+    """
+    # Follow ruamel.yaml, which writes bytes to any stream without an
+    # encoding attribute. Not all binary file objects are io.IOBase
+    # subclasses, e.g. those returned by tempfile.NamedTemporaryFile().
+    return not isinstance(fileobj, io.TextIOBase) and not hasattr(fileobj, "encoding")
+
+
+def _dump_json_fromdict(data, fp):
+    if _is_binary_fileobj(fp):
+        # Avoid a pointless decode/encode round trip.
+        fp.write(_dumps_json(data))
+    else:
+        fp.write(_dumps_json(data).decode("ascii"))
+
+
+# Functions for each supported format, to load a string, or dump to a fileobj.
+_LOADERS = {"json": _load_json, "yaml": _load_yaml_asdict}
+_DUMPERS = {"json": _dump_json_fromdict, "yaml": _dump_yaml_fromdict}
+
+
+def _get_format_func(funcs, format):
+    try:
+        return funcs[format]
+    except KeyError:
+        raise ValueError(f"unknown format: {format}") from None
+
+
 def loads_asdict(string, *, format="yaml"):
     """
     Load a YAML or JSON string into a dictionary of nested objects.
     The keywords and structure of the input are defined by the
     :ref:`spec:sec_ref`.
 
-    :param str string: The string to be loaded.
+    :param string: The string to be loaded.
+    :type string: Union[str, bytes]
     :param str format: The format of the input string. Either "yaml" or "json".
     :return: A dictionary of nested objects, with the same data model as the
         YAML or JSON input string.
     :rtype: dict
     """
-    with io.StringIO(string) as stream:
-        return load_asdict(stream, format=format)
+    loader = _get_format_func(_LOADERS, format)
+    return loader(string)
 
 
 def load_asdict(filename, *, format="yaml"):
@@ -75,22 +368,71 @@ def load_asdict(filename, *, format="yaml"):
     :ref:`spec:sec_ref`.
 
     :param filename: The path to the file to be loaded, or a file-like object
-        with a ``read()`` method.
+        with a ``read()`` method. Paths with a ``.zst`` suffix are decompressed
+        with Zstandard, which requires the ``zstandard`` package.
     :type filename: Union[str, os.PathLike, FileLike]
     :param str format: The format of the input file. Either "yaml" or "json".
     :return: A dictionary of nested objects, with the same data model as the
         YAML or JSON input.
     :rtype: dict
     """
-    if format == "json":
-        with _open_file_polymorph(filename) as f:
-            data = json.load(f)
-    elif format == "yaml":
-        with _open_file_polymorph(filename) as f:
-            data = _load_yaml_asdict(f)
+    # Check the format before reading the file, which may be slow.
+    _get_format_func(_LOADERS, format)
+    return loads_asdict(_read_polymorph(filename), format=format)
+
+
+# Pipelines such as parameter sweeps may load the same graph many times over.
+# Parsing dominates the cost of loading, so we keep the parsed data for
+# recently seen documents. The cache is keyed on a digest of the document's
+# contents, so it can't go stale, and it doesn't keep the documents alive.
+# The graph itself is still built from scratch each time, so callers get a
+# fresh object (and the same warnings) every time.
+#
+# A document's parsed data is only kept once the document has been seen
+# twice. So documents that are loaded just once are never copied: their
+# freshly parsed data is consumed by Graph._fromdict(). Repeated documents
+# are built with Graph.fromdict(), which leaves the cached data intact.
+_LOADS_CACHE_SIZE = 64
+# Maps (digest, format) to the parsed data, or to None if seen only once.
+_loads_cache: "collections.OrderedDict[Tuple[bytes, str], Any]" = (
+    collections.OrderedDict()
+)
+# Guards _loads_cache, so graphs may be loaded from multiple threads.
+# Documents are parsed outside the lock.
+_loads_cache_lock = threading.Lock()
+
+
+def _loads_graph(string, format):
+    if not isinstance(string, (str, bytes)):
+        return demes.Graph._fromdict(loads_asdict(string, format=format))
+
+    if isinstance(string, str):
+        # Lone surrogates can still be hashed, even if they won't parse.
+        buf = string.encode("utf-8", "surrogatepass")
     else:
-        raise ValueError(f"unknown format: {format}")
-    return data
+        buf = string
+    key = (hashlib.blake2b(buf).digest(), format)
+    with _loads_cache_lock:
+        seen = key in _loads_cache
+        if seen:
+            data = _loads_cache[key]
+            _loads_cache.move_to_end(key)
+        else:
+            data = None
+            _loads_cache[key] = None
+            while len(_loads_cache) > _LOADS_CACHE_SIZE:
+                _loads_cache.popitem(last=False)
+    if data is not None:
+        return demes.Graph.fromdict(data)
+
+    data = loads_asdict(string, format=format)
+    if not seen:
+        return demes.Graph._fromdict(data)
+    with _loads_cache_lock:
+        # The entry may have been evicted while we were parsing.
+        if key in _loads_cache:
+            _loads_cache[key] = data
+    return demes.Graph.fromdict(data)
 
 
 def loads(string, *, format="yaml"):
@@ -99,13 +441,13 @@ def loads(string, *, format="yaml"):
     The keywords and structure of the input are defined by the
     :ref:`spec:sec_ref`.
 
-    :param str string: The string to be loaded.
+    :param string: The string to be loaded.
+    :type string: Union[str, bytes]
     :param str format: The format of the input string. Either "yaml" or "json".
     :return: A graph.
     :rtype: .Graph
     """
-    data = loads_asdict(string, format=format)
-    return demes.Graph.fromdict(data)
+    return _loads_graph(string, format)
 
 
 def load(filename, *, format="yaml"):
@@ -115,14 +457,45 @@ def load(filename, *, format="yaml"):
     :ref:`spec:sec_ref`.
 
     :param filename: The path to the file to be loaded, or a file-like object
-        with a ``read()`` method.
+        with a ``read()`` method. Paths with a ``.zst`` suffix are decompressed
+        with Zstandard, which requires the ``zstandard`` package.
     :type filename: Union[str, os.PathLike, FileLike]
     :param str format: The format of the input file. Either "yaml" or "json".
     :return: A graph.
     :rtype: .Graph
     """
-    data = load_asdict(filename, format=format)
-    return demes.Graph.fromdict(data)
+    _get_format_func(_LOADERS, format)
+    return _loads_graph(_read_polymorph(filename), format)
+
+
+def load_many(filenames, *, format="yaml", max_workers=None):
+    """
+    Load graphs from multiple YAML or JSON files.
+    The keywords and structure of the inputs are defined by the
+    :ref:`spec:sec_ref`.
+
+    :param filenames: The paths to the files to be loaded, or file-like objects
+        with a ``read()`` method. As for :func:`.load`, paths with a ``.zst``
+        suffix are decompressed with Zstandard.
+    :type filenames: Iterable[Union[str, os.PathLike, FileLike]]
+    :param str format: The format of the input files. Either "yaml" or "json".
+    :param int max_workers: The maximum number of threads used to read the
+        files concurrently. If None, up to 32 threads are used.
+    :return: A list of graphs, in the same order as ``filenames``.
+    :rtype: list[.Graph]
+    """
+    import concurrent.futures
+
+    _get_format_func(_LOADERS, format)
+    filenames = list(filenames)
+    if max_workers is None:
+        max_workers = max(1, min(32, len(filenames)))
+    # Reading a file releases the GIL, so the files are read concurrently
+    # in a thread pool to overlap the IO latencies. Parsing holds the GIL,
+    # so there's nothing to gain from doing that in the pool too.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        contents = list(executor.map(_read_polymorph, filenames))
+    return [loads(content, format=format) for content in contents]
 
 
 def dumps(graph, *, format="yaml", simplified=True):
@@ -152,7 +525,9 @@ def dump(graph, filename, *, format="yaml", simplified=True):
 
     :param .Graph graph: The graph to dump.
     :param filename: Path to the output file, or a file-like object with a
-        ``write()`` method.
+        ``write()`` method. The file-like object may be opened in either
+        text or binary mode. Paths with a ``.zst`` suffix are compressed
+        with Zstandard, which requires the ``zstandard`` package.
     :type filename: Union[str, os.PathLike, FileLike]
     :param str format: The format of the output file. Either "yaml" or "json".
     :param bool simplified: If True, outputs a simplified graph. If False, outputs
@@ -163,11 +538,21 @@ def dump(graph, filename, *, format="yaml", simplified=True):
     else:
         data = graph.asdict()
 
-    if format == "json":
-        with _open_file_polymorph(filename, "w") as f:
-            json.dump(data, f)
-    elif format == "yaml":
-        with _open_file_polymorph(filename, "w") as f:
-            _dump_yaml_fromdict(data, f)
+    dumper = _get_format_func(_DUMPERS, format)
+    try:
+        path = os.fspath(filename)
+    except TypeError:
+        path = None
+
+    if path is None:
+        # Not a path, so assume it's a fileobj.
+        dumper(data, filename)
     else:
-        raise ValueError(f"unknown format: {format}")
+        # Build the whole document in memory, so that it can be written
+        # to the file with a single syscall (for all but huge documents).
+        with io.BytesIO() as stream:
+            dumper(data, stream)
+            buf = stream.getvalue()
+        if _is_zstd_path(path):
+            buf = _zstd_compress(buf)
+        _write_file(path, buf)
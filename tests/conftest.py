@@ -0,0 +1,28 @@
+import os
+
+import hypothesis as hyp
+import pytest
+
+import demes.load_dump
+
+# Generating graphs with demes.hypothesis_strategies.graphs() is slow,
+# and the time taken varies a lot between examples. So we disable the
+# deadline outright (rather than just increasing it), and cap the number
+# of examples to keep the test suite's runtime predictable.
+hyp.settings.register_profile(
+    "ci",
+    deadline=None,
+    max_examples=50,
+    suppress_health_check=[hyp.HealthCheck.too_slow],
+)
+# More thorough testing, e.g. HYPOTHESIS_PROFILE=thorough python -m pytest
+hyp.settings.register_profile(
+    "thorough", parent=hyp.settings.get_profile("ci"), max_examples=1000
+)
+hyp.settings.load_profile(os.environ.get("HYPOTHESIS_PROFILE", "ci"))
+
+
+@pytest.fixture(autouse=True)
+def clear_loads_cache():
+    # Don't let graphs parsed by one test leak into another.
+    demes.load_dump._loads_cache.clear()
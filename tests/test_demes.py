@@ -26,46 +26,8 @@ import demes.hypothesis_strategies
 
 
 class TestEpoch(unittest.TestCase):
-    def test_bad_time(self):
-        for time in ("0", "inf", {}, [], math.nan):
-            with self.assertRaises(TypeError):
-                Epoch(
-                    start_time=time,
-                    end_time=0,
-                    start_size=1,
-                    end_size=1,
-                    size_function="constant",
-                )
-            with self.assertRaises(TypeError):
-                Epoch(
-                    start_time=100,
-                    end_time=time,
-                    start_size=1,
-                    end_size=1,
-                    size_function="constant",
-                )
-
-        for start_time in (-10000, -1, -1e-9):
-            with self.assertRaises(ValueError):
-                Epoch(
-                    start_time=start_time,
-                    end_time=0,
-                    start_size=1,
-                    end_size=1,
-                    size_function="constant",
-                )
-        for end_time in (-10000, -1, -1e-9, math.inf):
-            with self.assertRaises(ValueError):
-                Epoch(
-                    start_time=100,
-                    end_time=end_time,
-                    start_size=1,
-                    end_size=1,
-                    size_function="constant",
-                )
-
     def test_bad_time_span(self):
-        with self.assertRaises(ValueError):
+        with pytest.raises(ValueError):
             Epoch(
                 start_time=1,
                 end_time=1,
@@ -73,7 +35,7 @@ class TestEpoch(unittest.TestCase):
                 end_size=1,
                 size_function="constant",
             )
-        with self.assertRaises(ValueError):
+        with pytest.raises(ValueError):
             Epoch(
                 start_time=1,
                 end_time=2,
@@ -82,55 +44,18 @@ class TestEpoch(unittest.TestCase):
                 size_function="constant",
             )
 
-    def test_bad_size(self):
-        for size in ("0", "100", {}, [], math.nan):
-            with self.assertRaises(TypeError):
-                Epoch(
-                    start_time=1,
-                    end_time=0,
-                    start_size=size,
-                    end_size=1,
-                    size_function="exponential",
-                )
-            with self.assertRaises(TypeError):
-                Epoch(
-                    start_time=1,
-                    end_time=0,
-                    start_size=1,
-                    end_size=size,
-                    size_function="exponential",
-                )
-
-        for size in (-10000, -1, -1e-9, 0, math.inf):
-            with self.assertRaises(ValueError):
-                Epoch(
-                    start_time=1,
-                    end_time=0,
-                    start_size=size,
-                    end_size=1,
-                    size_function="exponential",
-                )
-            with self.assertRaises(ValueError):
-                Epoch(
-                    start_time=1,
-                    end_time=0,
-                    start_size=1,
-                    end_size=size,
-                    size_function="exponential",
-                )
-
     def test_missing_values(self):
-        with self.assertRaises(TypeError):
+        with pytest.raises(TypeError):
             Epoch()
-        with self.assertRaises(TypeError):
+        with pytest.raises(TypeError):
             Epoch(start_time=1, end_time=0, start_size=1, end_size=1)
-        with self.assertRaises(TypeError):
+        with pytest.raises(TypeError):
             Epoch(start_time=1, end_time=0, start_size=1, size_function="constant")
-        with self.assertRaises(TypeError):
+        with pytest.raises(TypeError):
             Epoch(start_time=1, end_time=0, end_size=1, size_function="constant")
-        with self.assertRaises(TypeError):
+        with pytest.raises(TypeError):
             Epoch(start_time=1, start_size=1, end_size=1, size_function="constant")
-        with self.assertRaises(TypeError):
+        with pytest.raises(TypeError):
             Epoch(end_time=0, start_size=1, end_size=1, size_function="constant")
 
     def test_valid_epochs(self):
@@ -229,7 +154,7 @@ class TestEpoch(unittest.TestCase):
         self.assertEqual(e.time_span, 80)
 
     def test_inf_start_time_constant_epoch(self):
-        with self.assertRaises(ValueError):
+        with pytest.raises(ValueError):
             Epoch(
                 start_time=math.inf,
                 end_time=0,
@@ -237,7 +162,7 @@ class TestEpoch(unittest.TestCase):
                 end_size=20,
                 size_function="exponential",
             )
-        with self.assertRaises(ValueError):
+        with pytest.raises(ValueError):
             Epoch(
                 start_time=math.inf,
                 end_time=0,
@@ -353,7 +278,7 @@ class TestEpoch(unittest.TestCase):
 
     def test_bad_selfing_rate(self):
         for rate in ("0", "1e-4", "inf", [], {}, math.nan):
-            with self.assertRaises(TypeError):
+            with pytest.raises(TypeError):
                 Epoch(
                     start_time=100,
                     end_time=0,
@@ -364,7 +289,7 @@ class TestEpoch(unittest.TestCase):
                 )
 
         for rate in (-10000, 10000, -1, -1e-9, 1.2, math.inf):
-            with self.assertRaises(ValueError):
+            with pytest.raises(ValueError):
                 Epoch(
                     start_time=100,
                     end_time=0,
@@ -376,7 +301,7 @@ class TestEpoch(unittest.TestCase):
 
     def test_bad_cloning_rate(self):
         for rate in ("0", "1e-4", "inf", [], {}, math.nan):
-            with self.assertRaises(TypeError):
+            with pytest.raises(TypeError):
                 Epoch(
                     start_time=100,
                     end_time=0,
@@ -387,7 +312,7 @@ class TestEpoch(unittest.TestCase):
                 )
 
         for rate in (-10000, 10000, -1, -1e-9, 1.2, math.inf):
-            with self.assertRaises(ValueError):
+            with pytest.raises(ValueError):
                 Epoch(
                     start_time=100,
                     end_time=0,
@@ -398,7 +323,7 @@ class TestEpoch(unittest.TestCase):
                 )
 
     def test_bad_selfing_rate_cloning_rate_combination(self):
-        with self.assertRaises(ValueError):
+        with pytest.raises(ValueError):
             Epoch(
                 start_time=100,
                 end_time=0,
@@ -408,7 +333,7 @@ class TestEpoch(unittest.TestCase):
                 cloning_rate=0.5,
                 selfing_rate=0.5 + 1e-9,
             )
-        with self.assertRaises(ValueError):
+        with pytest.raises(ValueError):
             Epoch(
                 start_time=100,
                 end_time=0,
@@ -421,7 +346,7 @@ class TestEpoch(unittest.TestCase):
 
     def test_bad_size_function(self):
         for fn in (0, 1e5, [], {}, math.nan, "N(t) = 5 * t"):
-            with self.assertRaises(ValueError):
+            with pytest.raises(ValueError):
                 Epoch(
                     start_time=10,
                     end_time=0,
@@ -431,7 +356,7 @@ class TestEpoch(unittest.TestCase):
                 )
 
         for fn in ("", "constant"):
-            with self.assertRaises(ValueError):
+            with pytest.raises(ValueError):
                 Epoch(
                     start_time=10,
                     end_time=0,
@@ -441,71 +366,121 @@ class TestEpoch(unittest.TestCase):
                 )
 
 
-class TestMigration(unittest.TestCase):
-    def test_bad_time(self):
-        for time in ("inf", "100", {}, [], math.nan):
-            with self.assertRaises(TypeError):
-                AsymmetricMigration(
-                    source="a", dest="b", start_time=time, end_time=0, rate=0.1
-                )
-            with self.assertRaises(TypeError):
-                AsymmetricMigration(
-                    source="a", dest="b", start_time=100, end_time=time, rate=0.1
-                )
+@pytest.mark.parametrize("time", ["0", "inf", {}, [], math.nan])
+def test_epoch_bad_time_type(time):
+    with pytest.raises(TypeError):
+        Epoch(
+            start_time=time,
+            end_time=0,
+            start_size=1,
+            end_size=1,
+            size_function="constant",
+        )
+    with pytest.raises(TypeError):
+        Epoch(
+            start_time=100,
+            end_time=time,
+            start_size=1,
+            end_size=1,
+            size_function="constant",
+        )
 
-        for time in (-10000, -1, -1e-9):
-            with self.assertRaises(ValueError):
-                AsymmetricMigration(
-                    source="a", dest="b", start_time=time, end_time=0, rate=0.1
-                )
-        for time in (-10000, -1, -1e-9, math.inf):
-            with self.assertRaises(ValueError):
-                AsymmetricMigration(
-                    source="a", dest="b", start_time=100, end_time=time, rate=0.1
-                )
 
-        # start_time == end_time
-        with self.assertRaises(ValueError):
-            AsymmetricMigration(
-                source="a", dest="b", start_time=100, end_time=100, rate=0.1
-            )
+@pytest.mark.parametrize("start_time", [-10000, -1, -1e-9])
+def test_epoch_bad_start_time(start_time):
+    with pytest.raises(ValueError):
+        Epoch(
+            start_time=start_time,
+            end_time=0,
+            start_size=1,
+            end_size=1,
+            size_function="constant",
+        )
 
-        # start_time < end_time
-        with self.assertRaises(ValueError):
-            AsymmetricMigration(
-                source="a", dest="b", start_time=10, end_time=100, rate=0.1
-            )
 
+@pytest.mark.parametrize("end_time", [-10000, -1, -1e-9, math.inf])
+def test_epoch_bad_end_time(end_time):
+    with pytest.raises(ValueError):
+        Epoch(
+            start_time=100,
+            end_time=end_time,
+            start_size=1,
+            end_size=1,
+            size_function="constant",
+        )
+
+
+@pytest.mark.parametrize("size", ["0", "100", {}, [], math.nan])
+def test_epoch_bad_size_type(size):
+    with pytest.raises(TypeError):
+        Epoch(
+            start_time=1,
+            end_time=0,
+            start_size=size,
+            end_size=1,
+            size_function="exponential",
+        )
+    with pytest.raises(TypeError):
+        Epoch(
+            start_time=1,
+            end_time=0,
+            start_size=1,
+            end_size=size,
+            size_function="exponential",
+        )
+
+
+@pytest.mark.parametrize("size", [-10000, -1, -1e-9, 0, math.inf])
+def test_epoch_bad_size(size):
+    with pytest.raises(ValueError):
+        Epoch(
+            start_time=1,
+            end_time=0,
+            start_size=size,
+            end_size=1,
+            size_function="exponential",
+        )
+    with pytest.raises(ValueError):
+        Epoch(
+            start_time=1,
+            end_time=0,
+            start_size=1,
+            end_size=size,
+            size_function="exponential",
+        )
+
+
+class TestMigration(unittest.TestCase):
     def test_bad_rate(self):
         for rate in ("inf", "100", {}, [], math.nan):
-            with self.assertRaises(TypeError):
+            with pytest.raises(TypeError):
                 AsymmetricMigration(
                     source="a", dest="b", start_time=10, end_time=0, rate=rate
                 )
 
         for rate in (-10000, -1, -1e-9, 1.2, 100, math.inf):
-            with self.assertRaises(ValueError):
+            with pytest.raises(ValueError):
                 AsymmetricMigration(
                     source="a", dest="b", start_time=10, end_time=0, rate=rate
                 )
 
     def test_bad_demes(self):
         for name in (0, math.inf, 1e3, {}, []):
-            with self.assertRaises(TypeError):
+            with pytest.raises(TypeError):
                 AsymmetricMigration(
                     source=name, dest="a", start_time=10, end_time=0, rate=0.1
                 )
-            with self.assertRaises(TypeError):
+            with pytest.raises(TypeError):
                 AsymmetricMigration(
                     source="a", dest=name, start_time=10, end_time=0, rate=0.1
                 )
 
         for name in ("a", "", "pop 1"):
-            with self.assertRaises(ValueError):
+            with pytest.raises(ValueError):
                 AsymmetricMigration(
                     source=name, dest="a", start_time=10, end_time=0, rate=0.1
                 )
-            with self.assertRaises(ValueError):
+            with pytest.raises(ValueError):
                 AsymmetricMigration(
                     source="a", dest=name, start_time=10, end_time=0, rate=0.1
                 )
@@ -586,36 +561,60 @@ class TestMigration(unittest.TestCase):
         self.assertFalse(m1.isclose("foo"))
 
 
-class TestPulse(unittest.TestCase):
-    def test_bad_time(self):
-        for time in ("inf", "100", {}, [], math.nan):
-            with self.assertRaises(TypeError):
-                Pulse(source="a", dest="b", time=time, proportion=0.1)
+@pytest.mark.parametrize("time", ["inf", "100", {}, [], math.nan])
+def test_migration_bad_time_type(time):
+    with pytest.raises(TypeError):
+        AsymmetricMigration(source="a", dest="b", start_time=time, end_time=0, rate=0.1)
+    with pytest.raises(TypeError):
+        AsymmetricMigration(
+            source="a", dest="b", start_time=100, end_time=time, rate=0.1
+        )
 
-        for time in (-10000, -1, -1e-9, 0, math.inf):
-            with self.assertRaises(ValueError):
-                Pulse(source="a", dest="b", time=time, proportion=0.1)
 
-    def test_bad_proportion(self):
-        for proportion in ("inf", "100", {}, [], math.nan):
-            with self.assertRaises(TypeError):
-                Pulse(source="a", dest="b", time=1, proportion=proportion)
+@pytest.mark.parametrize("start_time", [-10000, -1, -1e-9])
+def test_migration_bad_start_time(start_time):
+    with pytest.raises(ValueError):
+        AsymmetricMigration(
+            source="a", dest="b", start_time=start_time, end_time=0, rate=0.1
+        )
 
-        for proportion in (-10000, -1, -1e-9, 1.2, 100, math.inf):
-            with self.assertRaises(ValueError):
-                Pulse(source="a", dest="b", time=1, proportion=proportion)
 
+@pytest.mark.parametrize("end_time", [-10000, -1, -1e-9, math.inf])
+def test_migration_bad_end_time(end_time):
+    with pytest.raises(ValueError):
+        AsymmetricMigration(
+            source="a", dest="b", start_time=100, end_time=end_time, rate=0.1
+        )
+
+
+@pytest.mark.parametrize(
+    "start_time,end_time",
+    [
+        # start_time == end_time
+        (100, 100),
+        # start_time < end_time
+        (10, 100),
+    ],
+)
+def test_migration_bad_time_span(start_time, end_time):
+    with pytest.raises(ValueError):
+        AsymmetricMigration(
+            source="a", dest="b", start_time=start_time, end_time=end_time, rate=0.1
+        )
+
+
+class TestPulse(unittest.TestCase):
     def test_bad_demes(self):
         for name in (None, 0, math.inf, 1e3, {}, []):
-            with self.assertRaises(TypeError):
+            with pytest.raises(TypeError):
                 Pulse(source=name, dest="a", time=1, proportion=0.1)
-            with self.assertRaises(TypeError):
+            with pytest.raises(TypeError):
                 Pulse(source="a", dest=name, time=1, proportion=0.1)
 
         for name in ("a", "", "pop 1"):
-            with self.assertRaises(ValueError):
+            with pytest.raises(ValueError):
                 Pulse(source=name, dest="a", time=1, proportion=0.1)
-            with self.assertRaises(ValueError):
+            with pytest.raises(ValueError):
                 Pulse(source="a", dest=name, time=1, proportion=0.1)
 
     def test_valid_pulse(self):
@@ -650,38 +649,62 @@ class TestPulse(unittest.TestCase):
         )
 
 
+@pytest.mark.parametrize("time", ["inf", "100", {}, [], math.nan])
+def test_pulse_bad_time_type(time):
+    with pytest.raises(TypeError):
+        Pulse(source="a", dest="b", time=time, proportion=0.1)
+
+
+@pytest.mark.parametrize("time", [-10000, -1, -1e-9, 0, math.inf])
+def test_pulse_bad_time(time):
+    with pytest.raises(ValueError):
+        Pulse(source="a", dest="b", time=time, proportion=0.1)
+
+
+@pytest.mark.parametrize("proportion", ["inf", "100", {}, [], math.nan])
+def test_pulse_bad_proportion_type(proportion):
+    with pytest.raises(TypeError):
+        Pulse(source="a", dest="b", time=1, proportion=proportion)
+
+
+@pytest.mark.parametrize("proportion", [-10000, -1, -1e-9, 1.2, 100, math.inf])
+def test_pulse_bad_proportion(proportion):
+    with pytest.raises(ValueError):
+        Pulse(source="a", dest="b", time=1, proportion=proportion)
+
+
 class TestSplit(unittest.TestCase):
     def test_bad_time(self):
         for time in ("inf", "100", {}, [], math.nan):
-            with self.assertRaises(TypeError):
+            with pytest.raises(TypeError):
                 Split(parent="a", children=["b", "c"], time=time)
 
         for time in [-1e-12, -1, math.inf]:
-            with self.assertRaises(ValueError):
+            with pytest.raises(ValueError):
                 Split(parent="a", children=["b", "c"], time=time)
 
     def test_bad_children(self):
         for children in (None, "b", {"b": 1}, set("b"), ("b",)):
-            with self.assertRaises(TypeError):
+            with pytest.raises(TypeError):
                 Split(parent="a", children=children, time=1)
         for name in (None, 0, math.inf, 1e3, {}, []):
-            with self.assertRaises(TypeError):
+            with pytest.raises(TypeError):
                 Split(parent="a", children=[name], time=1)
 
         for children in (["a", "b"], ["b", "b"], []):
-            with self.assertRaises(ValueError):
+            with pytest.raises(ValueError):
                 Split(parent="a", children=children, time=1)
         for name in ("a", "", "pop 1"):
-            with self.assertRaises(ValueError):
+            with pytest.raises(ValueError):
                 Split(parent="a", children=[name], time=1)
 
     def test_bad_parent(self):
         for name in (None, 0, math.inf, 1e3, {}, []):
-            with self.assertRaises(TypeError):
+            with pytest.raises(TypeError):
                 Split(parent=name, children=["b"], time=1)
 
         for name in ("a", "", "pop 1"):
-            with self.assertRaises(ValueError):
+            with pytest.raises(ValueError):
                 Split(parent=name, children=["a"], time=1)
 
     def test_valid_split(self):
@@ -714,29 +737,29 @@ class TestSplit(unittest.TestCase):
 class TestBranch(unittest.TestCase):
     def test_bad_time(self):
         for time in ("inf", "100", {}, [], math.nan):
-            with self.assertRaises(TypeError):
+            with pytest.raises(TypeError):
                 Branch(parent="a", child="b", time=time)
 
         for time in [-1e-12, -1, math.inf]:
-            with self.assertRaises(ValueError):
+            with pytest.raises(ValueError):
                 Branch(parent="a", child="b", time=time)
 
     def test_bad_child(self):
         for name in (None, 0, math.inf, 1e3, {}, []):
-            with self.assertRaises(TypeError):
+            with pytest.raises(TypeError):
                 Branch(parent="a", child=name, time=1)
 
         for name in ("a", "", "pop 1"):
-            with self.assertRaises(ValueError):
+            with pytest.raises(ValueError):
                 Branch(parent="a", child=name, time=1)
 
     def test_bad_parent(self):
         for name in (None, 0, math.inf, 1e3, {}, []):
-            with self.assertRaises(TypeError):
+            with pytest.raises(TypeError):
                 Branch(parent=name, child="b", time=1)
 
         for name in ("a", "", "pop 1"):
-            with self.assertRaises(ValueError):
+            with pytest.raises(ValueError):
                 Branch(parent=name, child="a", time=1)
 
     def test_valid_branch(self):
@@ -760,72 +783,72 @@ class TestBranch(unittest.TestCase):
 class TestMerge(unittest.TestCase):
     def test_bad_time(self):
         for time in ("inf", "100", {}, [], math.nan):
-            with self.assertRaises(TypeError):
+            with pytest.raises(TypeError):
                 Merge(parents=["a", "b"], proportions=[0.5, 0.5], child="c", time=time)
 
         for time in [-1e-12, -1, math.inf]:
-            with self.assertRaises(ValueError):
+            with pytest.raises(ValueError):
                 Merge(parents=["a", "b"], proportions=[0.5, 0.5], child="c", time=time)
 
     def test_bad_child(self):
         for name in (None, 0, math.inf, 1e3, {}, []):
-            with self.assertRaises(TypeError):
+            with pytest.raises(TypeError):
                 Merge(parents=["a", "b"], proportions=[0.5, 0.5], child=name, time=1)
 
         for name in ("a", "b", "", "pop 1"):
-            with self.assertRaises(ValueError):
+            with pytest.raises(ValueError):
                 Merge(parents=["a", "b"], proportions=[0.5, 0.5], child=name, time=1)
 
     def test_bad_parents(self):
         for parents in (None, "b", {"b": 1}, set("b"), ("b", "b")):
-            with self.assertRaises(TypeError):
+            with pytest.raises(TypeError):
                 Merge(parents=parents, proportions=[0.5, 0.5], child="c", time=1)
         for name in (None, 0, math.inf, 1e3, {}, []):
-            with self.assertRaises(TypeError):
+            with pytest.raises(TypeError):
                 Merge(parents=["a", name], proportions=[0.5, 0.5], child="c", time=1)
-            with self.assertRaises(TypeError):
+            with pytest.raises(TypeError):
                 Merge(parents=[name, "a"], proportions=[0.5, 0.5], child="c", time=1)
 
         for name in ("a", "c", "", "pop 1"):
-            with self.assertRaises(ValueError):
+            with pytest.raises(ValueError):
                 Merge(parents=["a", name], proportions=[0.5, 0.5], child="c", time=1)
-            with self.assertRaises(ValueError):
+            with pytest.raises(ValueError):
                 Merge(parents=[name, "a"], proportions=[0.5, 0.5], child="c", time=1)
-        with self.assertRaises(ValueError):
+        with pytest.raises(ValueError):
             Merge(parents=["a"], proportions=[1], child="b", time=1)
 
     def test_bad_proportions(self):
         for proportion in ("inf", "100", {}, [], math.nan):
-            with self.assertRaises(TypeError):
+            with pytest.raises(TypeError):
                 Merge(parents=["a", "b"], child="c", time=1, proportions=[proportion])
 
         for proportion in (-10000, -1, -1e-9, 1.2, 100, math.inf):
-            with self.assertRaises(ValueError):
+            with pytest.raises(ValueError):
                 Merge(
                     parents=["a", "b"], child="c", time=1, proportions=[proportion, 0.5]
                 )
-            with self.assertRaises(ValueError):
+            with pytest.raises(ValueError):
                 Merge(
                     parents=["a", "b"], child="c", time=1, proportions=[0.5, proportion]
                 )
 
-        with self.assertRaises(ValueError):
+        with pytest.raises(ValueError):
             Merge(parents=["a", "b"], proportions=[1], child="b", time=1)
-        with self.assertRaises(ValueError):
+        with pytest.raises(ValueError):
             Merge(parents=["a", "b", "c"], proportions=[0.5, 0.5], child="b", time=1)
-        with self.assertRaises(ValueError):
+        with pytest.raises(ValueError):
             Merge(
                 parents=["a", "b"], proportions=[1 / 3, 1 / 3, 1 / 3], child="b", time=1
             )
-        with self.assertRaises(ValueError):
+        with pytest.raises(ValueError):
             Merge(parents=["a", "b"], proportions=[0.1, 1], child="c", time=1)
-        with self.assertRaises(ValueError):
+        with pytest.raises(ValueError):
             Merge(parents=["a", "b"], proportions=[-0.1, 1.1], child="c", time=1)
-        with self.assertRaises(ValueError):
+        with pytest.raises(ValueError):
             Merge(parents=["a", "b"], proportions=[0.5], child="c", time=1)
-        with self.assertRaises(ValueError):
+        with pytest.raises(ValueError):
             Merge(parents=["a", "b"], proportions=[1.0], child="c", time=1)
-        with self.assertRaises(ValueError):
+        with pytest.raises(ValueError):
             Merge(
                 parents=["a", "b", "c"], proportions=[0.5, 0.5, 0.5], child="d", time=1
             )
@@ -928,72 +951,72 @@ class TestMerge(unittest.TestCase):
 class TestAdmix(unittest.TestCase):
     def test_bad_time(self):
         for time in ("inf", "100", {}, [], math.nan):
-            with self.assertRaises(TypeError):
+            with pytest.raises(TypeError):
                 Admix(parents=["a", "b"], proportions=[0.5, 0.5], child="c", time=time)
 
         for time in [-1e-12, -1, math.inf]:
-            with self.assertRaises(ValueError):
+            with pytest.raises(ValueError):
                 Admix(parents=["a", "b"], proportions=[0.5, 0.5], child="c", time=time)
 
     def test_bad_child(self):
         for name in (None, 0, math.inf, 1e3, {}, []):
-            with self.assertRaises(TypeError):
+            with pytest.raises(TypeError):
                 Admix(parents=["a", "b"], proportions=[0.5, 0.5], child=name, time=1)
 
         for name in ("a", "b", "", "pop 1"):
-            with self.assertRaises(ValueError):
+            with pytest.raises(ValueError):
                 Admix(parents=["a", "b"], proportions=[0.5, 0.5], child=name, time=1)
 
     def test_bad_parents(self):
         for parents in (None, "b", {"b": 1}, set("b"), ("b", "b")):
-            with self.assertRaises(TypeError):
+            with pytest.raises(TypeError):
                 Admix(parents=parents, proportions=[0.5, 0.5], child="c", time=1)
         for name in (None, 0, math.inf, 1e3, {}, []):
-            with self.assertRaises(TypeError):
+            with pytest.raises(TypeError):
                 Admix(parents=["a", name], proportions=[0.5, 0.5], child="c", time=1)
-            with self.assertRaises(TypeError):
+            with pytest.raises(TypeError):
                 Admix(parents=[name, "a"], proportions=[0.5, 0.5], child="c", time=1)
 
         for name in ("a", "c", "", "pop 1"):
-            with self.assertRaises(ValueError):
+            with pytest.raises(ValueError):
                 Admix(parents=["a", name], proportions=[0.5, 0.5], child="c", time=1)
-            with self.assertRaises(ValueError):
+            with pytest.raises(ValueError):
                 Admix(parents=[name, "a"], proportions=[0.5, 0.5], child="c", time=1)
-        with self.assertRaises(ValueError):
+        with pytest.raises(ValueError):
             Admix(parents=["a"], proportions=[1], child="b", time=1)
 
     def test_bad_proportions(self):
         for proportion in ("inf", "100", {}, [], math.nan):
-            with self.assertRaises(TypeError):
+            with pytest.raises(TypeError):
                 Admix(parents=["a", "b"], child="c", time=1, proportions=[proportion])
 
         for proportion in (-10000, -1, -1e-9, 1.2, 100, math.inf):
-            with self.assertRaises(ValueError):
+            with pytest.raises(ValueError):
                 Admix(
                     parents=["a", "b"], child="c", time=1, proportions=[proportion, 0.5]
                 )
-            with self.assertRaises(ValueError):
+            with pytest.raises(ValueError):
                 Admix(
                     parents=["a", "b"], child="c", time=1, proportions=[0.5, proportion]
                 )
 
-        with self.assertRaises(ValueError):
+        with pytest.raises(ValueError):
             Admix(parents=["a", "b"], proportions=[1], child="b", time=1)
-        with self.assertRaises(ValueError):
+        with pytest.raises(ValueError):
             Admix(parents=["a", "b", "c"], proportions=[0.5, 0.5], child="b", time=1)
-        with self.assertRaises(ValueError):
+        with pytest.raises(ValueError):
             Admix(
                 parents=["a", "b"], proportions=[1 / 3, 1 / 3, 1 / 3], child="b", time=1
             )
-        with self.assertRaises(ValueError):
+        with pytest.raises(ValueError):
             Admix(parents=["a", "b"], proportions=[0.1, 1], child="c", time=1)
-        with self.assertRaises(ValueError):
+        with pytest.raises(ValueError):
             Admix(parents=["a", "b"], proportions=[-0.1, 1.1], child="c", time=1)
-        with self.assertRaises(ValueError):
+        with pytest.raises(ValueError):
             Admix(parents=["a", "b"], proportions=[0.5], child="c", time=1)
-        with self.assertRaises(ValueError):
+        with pytest.raises(ValueError):
             Admix(parents=["a", "b"], proportions=[1.0], child="c", time=1)
-        with self.assertRaises(ValueError):
+        with pytest.raises(ValueError):
             Admix(
                 parents=["a", "b", "c"], proportions=[0.5, 0.5, 0.5], child="d", time=1
             )
@@ -1174,593 +1197,331 @@ class TestDeme(unittest.TestCase):
         self.assertEqual(deme.description, None)
 
     def test_bad_id(self):
+        epoch = Epoch(
+            start_time=math.inf,
+            end_time=0,
+            start_size=1,
+            end_size=1,
+            size_function="constant",
+        )
         for name in (None, 0, math.inf, 1e3, {}, []):
-            with self.assertRaises(TypeError):
+            with pytest.raises(TypeError):
                 Deme(
                     name=name,
                     description="b",
                     ancestors=[],
                     proportions=[],
                     start_time=math.inf,
-                    epochs=[
-                        Epoch(
-                            start_time=math.inf,
-                            end_time=0,
-                            start_size=1,
-                            end_size=1,
-                            size_function="constant",
-                        )
-                    ],
+                    epochs=[epoch],
                 )
         for name in ["", "501", "pop-1", "pop.2", "pop 3"]:
-            with self.assertRaises(ValueError):
+            with pytest.raises(ValueError):
                 Deme(
                     name=name,
                     description="b",
                     ancestors=[],
                     proportions=[],
                     start_time=math.inf,
-                    epochs=[
-                        Epoch(
-                            start_time=math.inf,
-                            end_time=0,
-                            start_size=1,
-                            end_size=1,
-                            size_function="constant",
-                        )
-                    ],
+                    epochs=[epoch],
                 )
 
     def test_bad_description(self):
+        epoch = Epoch(
+            start_time=math.inf,
+            end_time=0,
+            start_size=1,
+            end_size=1,
+            size_function="constant",
+        )
         for description in (0, math.inf, 1e3, {}, []):
-            with self.assertRaises(TypeError):
+            with pytest.raises(TypeError):
                 Deme(
                     name="a",
                     description=description,
                     ancestors=[],
                     proportions=[],
                     start_time=math.inf,
-                    epochs=[
-                        Epoch(
-                            start_time=math.inf,
-                            end_time=0,
-                            start_size=1,
-                            end_size=1,
-                            size_function="constant",
-                        )
-                    ],
+                    epochs=[epoch],
                 )
-        with self.assertRaises(ValueError):
+        with pytest.raises(ValueError):
             Deme(
                 name="a",
                 description="",
                 ancestors=[],
                 proportions=[],
                 start_time=math.inf,
-                epochs=[
-                    Epoch(
-                        start_time=math.inf,
-                        end_time=0,
-                        start_size=1,
-                        end_size=1,
-                        size_function="constant",
-                    )
-                ],
+                epochs=[epoch],
             )
 
     def test_bad_ancestors(self):
+        epoch = Epoch(
+            start_time=10,
+            end_time=0,
+            start_size=1,
+            end_size=1,
+            size_function="constant",
+        )
         for ancestors in (None, "c", {}):
-            with self.assertRaises(TypeError):
+            with pytest.raises(TypeError):
                 Deme(
                     name="a",
                     description="b",
                     ancestors=ancestors,
                     proportions=[1],
                     start_time=10,
-                    epochs=[
-                        Epoch(
-                            start_time=10,
-                            end_time=0,
-                            start_size=1,
-                            end_size=1,
-                            size_function="constant",
-                        )
-                    ],
+                    epochs=[epoch],
                 )
         for name in (None, 0, math.inf, 1e3, {}, []):
-            with self.assertRaises(TypeError):
+            with pytest.raises(TypeError):
                 Deme(
                     name="a",
                     description="b",
                     ancestors=[name],
                     proportions=[1],
                     start_time=10,
-                    epochs=[
-                        Epoch(
-                            start_time=10,
-                            end_time=0,
-                            start_size=1,
-                            end_size=1,
-                            size_function="constant",
-                        )
-                    ],
+                    epochs=[epoch],
                 )
         for name in ["", "501", "pop-1", "pop.2", "pop 3"]:
-            with self.assertRaises(ValueError):
+            with pytest.raises(ValueError):
                 Deme(
                     name="a",
                     description="b",
                     ancestors=[name],
                     proportions=[1],
                     start_time=10,
-                    epochs=[
-                        Epoch(
-                            start_time=10,
-                            end_time=0,
-                            start_size=1,
-                            end_size=1,
-                            size_function="constant",
-                        )
-                    ],
+                    epochs=[epoch],
                 )
 
-        with self.assertRaises(ValueError):
+        with pytest.raises(ValueError):
             Deme(
                 name="a",
                 description="b",
                 ancestors=["a", "c"],
                 proportions=[0.5, 0.5],
                 start_time=10,
-                epochs=[
-                    Epoch(
-                        start_time=10,
-                        end_time=0,
-                        start_size=1,
-                        end_size=1,
-                        size_function="constant",
-                    )
-                ],
-            )
-        with self.assertRaises(ValueError):
+                epochs=[epoch],
+            )
+        with pytest.raises(ValueError):
             # duplicate ancestors
             Deme(
                 name="a",
                 description="test",
                 ancestors=["x", "x"],
                 proportions=[0.5, 0.5],
-                start_time=10,
-                epochs=[
-                    Epoch(
-                        start_time=10,
-                        end_time=0,
-                        start_size=1,
-                        end_size=1,
-                        size_function="constant",
-                    )
-                ],
-            )
-
-    def test_bad_proportions(self):
-        for proportions in (None, {}, 1e5, "proportions", math.nan):
-            with self.assertRaises(TypeError):
-                Deme(
-                    name="a",
-                    description="test",
-                    ancestors=[],
-                    proportions=proportions,
-                    start_time=10,
-                    epochs=[
-                        Epoch(
-                            start_time=10,
-                            end_time=0,
-                            start_size=1,
-                            end_size=1,
-                            size_function="constant",
-                        )
-                    ],
-                )
-        for proportion in (None, "inf", "100", {}, [], math.nan):
-            with self.assertRaises(TypeError):
-                Deme(
-                    name="a",
-                    description="test",
-                    ancestors=["b"],
-                    proportions=[proportion],
-                    start_time=10,
-                    epochs=[
-                        Epoch(
-                            start_time=10,
-                            end_time=0,
-                            start_size=1,
-                            end_size=1,
-                            size_function="constant",
-                        )
-                    ],
-                )
-
-        for proportions in (
-            [0.6, 0.7],
-            [-0.5, 1.5],
-            [0, 1.0],
-            [0.5, 0.2, 0.3],
-        ):
-            with self.assertRaises(ValueError):
-                Deme(
-                    name="a",
-                    description="test",
-                    ancestors=["x", "y"],
-                    proportions=proportions,
-                    start_time=10,
-                    epochs=[
-                        Epoch(
-                            start_time=10,
-                            end_time=0,
-                            start_size=1,
-                            end_size=1,
-                            size_function="constant",
-                        )
-                    ],
-                )
-
-        for proportion in (-10000, -1, -1e-9, 1.2, 100, math.inf):
-            with self.assertRaises(ValueError):
-                Deme(
-                    name="a",
-                    description="test",
-                    ancestors=["b", "c"],
-                    proportions=[0.5, proportion],
-                    start_time=10,
-                    epochs=[
-                        Epoch(
-                            start_time=10,
-                            end_time=0,
-                            start_size=1,
-                            end_size=1,
-                            size_function="constant",
-                        )
-                    ],
-                )
-            with self.assertRaises(ValueError):
-                Deme(
-                    name="a",
-                    description="test",
-                    ancestors=["b", "c"],
-                    proportions=[proportion, 0.5],
-                    start_time=10,
-                    epochs=[
-                        Epoch(
-                            start_time=10,
-                            end_time=0,
-                            start_size=1,
-                            end_size=1,
-                            size_function="constant",
-                        )
-                    ],
-                )
-
-    def test_epochs_out_of_order(self):
-        for time in (5, -1, math.inf):
-            with self.assertRaises(ValueError):
-                Deme(
-                    name="a",
-                    description="b",
-                    ancestors=["c"],
-                    proportions=[1],
-                    start_time=10,
-                    epochs=[
-                        Epoch(
-                            start_time=10,
-                            end_time=5,
-                            start_size=1,
-                            end_size=1,
-                            size_function="constant",
-                        ),
-                        Epoch(
-                            start_time=5,
-                            end_time=time,
-                            start_size=100,
-                            end_size=100,
-                            size_function="constant",
-                        ),
-                    ],
-                )
-
-    def test_epochs_are_a_partition(self):
-        for start_time, end_time in [(math.inf, 100), (200, 100)]:
-            with self.assertRaises(ValueError):
-                Deme(
-                    name="a",
-                    description="b",
-                    ancestors=["c"],
-                    proportions=[1],
-                    start_time=start_time,
-                    epochs=[
-                        Epoch(
-                            start_time=start_time,
-                            end_time=end_time,
-                            start_size=1,
-                            end_size=1,
-                            size_function="constant",
-                        ),
-                        Epoch(
-                            start_time=50,
-                            end_time=0,
-                            start_size=2,
-                            end_size=2,
-                            size_function="constant",
-                        ),
-                    ],
-                )
-
-    def test_bad_epochs(self):
-        for epochs in (None, {}, "Epoch"):
-            with self.assertRaises(TypeError):
-                Deme(
-                    name="a",
-                    description="b",
-                    ancestors=["c"],
-                    proportions=[1],
-                    start_time=10,
-                    epochs=epochs,
-                )
-
-    def test_time_span(self):
-        for start_time, end_time in zip((math.inf, 100, 20), (0, 20, 0)):
-            deme = Deme(
-                name="a",
-                description="b",
-                ancestors=["c"],
-                proportions=[1],
-                start_time=start_time,
-                epochs=[
-                    Epoch(
-                        start_time=start_time,
-                        end_time=end_time,
-                        start_size=1,
-                        end_size=1,
-                        size_function="constant",
-                    )
-                ],
-            )
-            self.assertEqual(deme.time_span, start_time - end_time)
-        with self.assertRaises(ValueError):
-            deme = Deme(
-                name="a",
-                description="b",
-                ancestors=["c"],
-                proportions=[1],
-                start_time=100,
-                epochs=[
-                    Epoch(
-                        start_time=100,
-                        end_time=100,
-                        start_size=1,
-                        end_size=1,
-                        size_function="constant",
-                    )
-                ],
-            )
-
-    def test_isclose(self):
-        d1 = Deme(
-            name="a",
-            description="foo deme",
-            ancestors=[],
-            proportions=[],
-            start_time=10,
-            epochs=[
-                Epoch(
-                    start_time=10,
-                    end_time=5,
-                    start_size=1,
-                    end_size=1,
-                    size_function="exponential",
-                )
-            ],
-        )
-        self.assertTrue(d1.isclose(d1))
-        self.assertTrue(
-            d1.isclose(
-                Deme(
-                    name="a",
-                    description="foo deme",
-                    ancestors=[],
-                    proportions=[],
-                    start_time=10,
-                    epochs=[
-                        Epoch(
-                            start_time=10,
-                            end_time=5,
-                            start_size=1,
-                            end_size=1,
-                            size_function="exponential",
-                        )
-                    ],
-                )
-            )
-        )
-        # Description field doesn't matter.
-        self.assertTrue(
-            d1.isclose(
-                Deme(
-                    name="a",
-                    description="bar deme",
-                    ancestors=[],
-                    proportions=[],
-                    start_time=10,
-                    epochs=[
-                        Epoch(
-                            start_time=10,
-                            end_time=5,
-                            start_size=1,
-                            end_size=1,
-                            size_function="exponential",
-                        )
-                    ],
-                )
-            )
-        )
-
-        #
-        # Check inequalities.
-        #
-
-        self.assertFalse(
-            d1.isclose(
-                Deme(
-                    name="b",
-                    description="foo deme",
-                    ancestors=[],
-                    proportions=[],
-                    start_time=10,
-                    epochs=[
-                        Epoch(
-                            start_time=10,
-                            end_time=5,
-                            start_size=1,
-                            end_size=1,
-                            size_function="exponential",
-                        )
-                    ],
-                )
-            )
-        )
-        self.assertFalse(
-            d1.isclose(
-                Deme(
-                    name="a",
-                    description="foo deme",
-                    ancestors=["x"],
-                    proportions=[1],
-                    start_time=10,
-                    epochs=[
-                        Epoch(
-                            start_time=10,
-                            end_time=5,
-                            start_size=1,
-                            end_size=1,
-                            size_function="exponential",
-                        )
-                    ],
-                )
+                start_time=10,
+                epochs=[epoch],
             )
+
+    def test_bad_proportions(self):
+        # Only the ancestors and proportions differ between the cases below.
+        kwargs = dict(name="a", description="test", start_time=10)
+        epoch = Epoch(
+            start_time=10,
+            end_time=0,
+            start_size=1,
+            end_size=1,
+            size_function="constant",
         )
-        self.assertFalse(
-            d1.isclose(
+
+        for proportions in (None, {}, 1e5, "proportions", math.nan):
+            with pytest.raises(TypeError):
+                Deme(ancestors=[], proportions=proportions, epochs=[epoch], **kwargs)
+        for proportion in (None, "inf", "100", {}, [], math.nan):
+            with pytest.raises(TypeError):
                 Deme(
-                    name="a",
-                    description="foo deme",
-                    ancestors=[],
-                    proportions=[],
-                    start_time=9,
-                    epochs=[
-                        Epoch(
-                            start_time=9,
-                            end_time=5,
-                            start_size=1,
-                            end_size=1,
-                            size_function="exponential",
-                        )
-                    ],
+                    ancestors=["b"], proportions=[proportion], epochs=[epoch], **kwargs
                 )
-            )
-        )
-        self.assertFalse(
-            d1.isclose(
+
+        for proportions in (
+            [0.6, 0.7],
+            [-0.5, 1.5],
+            [0, 1.0],
+            [0.5, 0.2, 0.3],
+        ):
+            with pytest.raises(ValueError):
                 Deme(
-                    name="a",
-                    description="foo deme",
-                    ancestors=[],
-                    proportions=[],
-                    start_time=10,
-                    epochs=[
-                        Epoch(
-                            start_time=10,
-                            end_time=9,
-                            start_size=1,
-                            end_size=1,
-                            size_function="exponential",
-                        )
-                    ],
+                    ancestors=["x", "y"],
+                    proportions=proportions,
+                    epochs=[epoch],
+                    **kwargs,
                 )
-            )
-        )
 
-        self.assertFalse(
-            d1.isclose(
+        for proportion in (-10000, -1, -1e-9, 1.2, 100, math.inf):
+            with pytest.raises(ValueError):
                 Deme(
-                    name="a",
-                    description="foo deme",
-                    ancestors=[],
-                    proportions=[],
-                    start_time=10,
-                    epochs=[
-                        Epoch(
-                            start_time=10,
-                            end_time=5,
-                            start_size=9,
-                            end_size=1,
-                            size_function="exponential",
-                        )
-                    ],
+                    ancestors=["b", "c"],
+                    proportions=[0.5, proportion],
+                    epochs=[epoch],
+                    **kwargs,
                 )
-            )
+            with pytest.raises(ValueError):
+                Deme(
+                    ancestors=["b", "c"],
+                    proportions=[proportion, 0.5],
+                    epochs=[epoch],
+                    **kwargs,
+                )
+
+    def test_epochs_out_of_order(self):
+        kwargs = dict(name="a", description="b", ancestors=["c"], proportions=[1])
+        epoch = Epoch(
+            start_time=10,
+            end_time=5,
+            start_size=1,
+            end_size=1,
+            size_function="constant",
         )
-        self.assertFalse(
-            d1.isclose(
+        for time in (5, -1, math.inf):
+            with pytest.raises(ValueError):
                 Deme(
-                    name="a",
-                    description="foo deme",
-                    ancestors=[],
-                    proportions=[],
                     start_time=10,
                     epochs=[
+                        epoch,
                         Epoch(
-                            start_time=10,
-                            end_time=5,
-                            start_size=1,
-                            end_size=1,
-                            size_function="exponential",
-                            selfing_rate=0.1,
-                        )
+                            start_time=5,
+                            end_time=time,
+                            start_size=100,
+                            end_size=100,
+                            size_function="constant",
+                        ),
                     ],
+                    **kwargs,
                 )
-            )
+
+    def test_epochs_are_a_partition(self):
+        kwargs = dict(name="a", description="b", ancestors=["c"], proportions=[1])
+        epoch = Epoch(
+            start_time=50,
+            end_time=0,
+            start_size=2,
+            end_size=2,
+            size_function="constant",
         )
-        self.assertFalse(
-            d1.isclose(
+        for start_time, end_time in [(math.inf, 100), (200, 100)]:
+            with pytest.raises(ValueError):
                 Deme(
-                    name="a",
-                    description="foo deme",
-                    ancestors=[],
-                    proportions=[],
-                    start_time=10,
+                    start_time=start_time,
                     epochs=[
                         Epoch(
-                            start_time=10,
-                            end_time=5,
+                            start_time=start_time,
+                            end_time=end_time,
                             start_size=1,
                             end_size=1,
-                            size_function="exponential",
-                            cloning_rate=0.1,
-                        )
+                            size_function="constant",
+                        ),
+                        epoch,
                     ],
+                    **kwargs,
                 )
+
+    def test_bad_epochs(self):
+        kwargs = dict(name="a", description="b", ancestors=["c"], proportions=[1])
+        for epochs in (None, {}, "Epoch"):
+            with pytest.raises(TypeError):
+                Deme(start_time=10, epochs=epochs, **kwargs)
+
+
+@pytest.mark.parametrize("start_time,end_time", [(math.inf, 0), (100, 20), (20, 0)])
+def test_deme_time_span(start_time, end_time):
+    deme = Deme(
+        name="a",
+        description="b",
+        ancestors=["c"],
+        proportions=[1],
+        start_time=start_time,
+        epochs=[
+            Epoch(
+                start_time=start_time,
+                end_time=end_time,
+                start_size=1,
+                end_size=1,
+                size_function="constant",
             )
+        ],
+    )
+    assert deme.time_span == start_time - end_time
+
+
+def test_deme_zero_time_span():
+    with pytest.raises(ValueError):
+        Deme(
+            name="a",
+            description="b",
+            ancestors=["c"],
+            proportions=[1],
+            start_time=100,
+            epochs=[
+                Epoch(
+                    start_time=100,
+                    end_time=100,
+                    start_size=1,
+                    end_size=1,
+                    size_function="constant",
+                )
+            ],
         )
 
 
+def isclose_deme(epoch_kwargs=None, **kwargs):
+    """
+    Return the reference deme for test_deme_isclose(), with the given deme
+    fields, and the given fields of its single epoch, replaced.
+    """
+    deme_kwargs = dict(
+        name="a",
+        description="foo deme",
+        ancestors=[],
+        proportions=[],
+        start_time=10,
+    )
+    deme_kwargs.update(kwargs)
+    epoch = dict(
+        start_time=deme_kwargs["start_time"],
+        end_time=5,
+        start_size=1,
+        end_size=1,
+        size_function="exponential",
+    )
+    epoch.update(epoch_kwargs or {})
+    return Deme(epochs=[Epoch(**epoch)], **deme_kwargs)
+
+
+def test_deme_isclose_self():
+    d1 = isclose_deme()
+    assert d1.isclose(d1)
+
+
+@pytest.mark.parametrize(
+    "kwargs,expected",
+    [
+        (dict(), True),
+        # Description field doesn't matter.
+        (dict(description="bar deme"), True),
+        (dict(name="b"), False),
+        (dict(ancestors=["x"], proportions=[1]), False),
+        (dict(start_time=9), False),
+        (dict(epoch_kwargs=dict(end_time=9)), False),
+        (dict(epoch_kwargs=dict(start_size=9)), False),
+        (dict(epoch_kwargs=dict(selfing_rate=0.1)), False),
+        (dict(epoch_kwargs=dict(cloning_rate=0.1)), False),
+    ],
+)
+def test_deme_isclose(kwargs, expected):
+    d1 = isclose_deme()
+    assert d1.isclose(isclose_deme(**kwargs)) is expected
+
+
 class TestGraph(unittest.TestCase):
     def test_bad_generation_time(self):
         for generation_time in ([], {}, "42", "inf", math.nan):
-            with self.assertRaises(TypeError):
+            with pytest.raises(TypeError):
                 Graph(
                     description="test",
                     time_units="years",
                     generation_time=generation_time,
                 )
         for generation_time in (-100, -1e-9, 0, math.inf, None):
-            with self.assertRaises(ValueError):
+            with pytest.raises(ValueError):
                 Graph(
                     description="test",
                     time_units="years",
@@ -1774,12 +1535,12 @@ class TestGraph(unittest.TestCase):
 
     def test_bad_description(self):
         for description in ([], {}, 0, 1e5, math.inf):
-            with self.assertRaises(TypeError):
+            with pytest.raises(TypeError):
                 Graph(
                     description=description,
                     time_units="generations",
                 )
-        with self.assertRaises(ValueError):
+        with pytest.raises(ValueError):
             Graph(
                 description="",
                 time_units="generations",
@@ -1789,33 +1550,24 @@ class TestGraph(unittest.TestCase):
         # We currently accept arbitrary strings in DOIs.
         # In any event here are some examples that should always be accepted.
         # https://www.doi.org/doi_handbook/2_Numbering.html
-        for doi in [
-            "10.1000/123456",
-            "10.1000.10/123456",
-            "10.1038/issn.1476-4687",
-            # old doi proxy url; still supported
-            "http://dx.doi.org/10.1006/jmbi.1998.2354",
-            "https://dx.doi.org/10.1006/jmbi.1998.2354",
-            # recommended doi proxy
-            "http://doi.org/10.1006/jmbi.1998.2354",
-            # https preferred
-            "https://doi.org/10.1006/jmbi.1998.2354",
-            # some symbols (e.g. #) must be encoded for the url to work
-            "https://doi.org/10.1000/456%23789",
-        ]:
-            Graph(
-                description="test",
-                time_units="generations",
-                doi=[doi],
-            )
-
-        # multiple DOIs
+        # The DOIs are validated independently, so they can all be checked
+        # with a single graph. This also covers having multiple DOIs.
         Graph(
             description="test",
             time_units="generations",
             doi=[
+                "10.1000/123456",
+                "10.1000.10/123456",
                 "10.1038/issn.1476-4687",
+                # old doi proxy url; still supported
+                "http://dx.doi.org/10.1006/jmbi.1998.2354",
+                "https://dx.doi.org/10.1006/jmbi.1998.2354",
+                # recommended doi proxy
+                "http://doi.org/10.1006/jmbi.1998.2354",
+                # https preferred
                 "https://doi.org/10.1006/jmbi.1998.2354",
+                # some symbols (e.g. #) must be encoded for the url to work
+                "https://doi.org/10.1000/456%23789",
             ],
         )
 
@@ -1828,21 +1580,21 @@ class TestGraph(unittest.TestCase):
 
     def test_bad_doi(self):
         for doi_list in ({}, "10.1000/123456", math.inf, 1e5, 0):
-            with self.assertRaises(TypeError):
+            with pytest.raises(TypeError):
                 Graph(
                     description="test",
                     time_units="generations",
                     doi=doi_list,
                 )
         for doi in (None, {}, [], math.inf, 1e5, 0):
-            with self.assertRaises(TypeError):
+            with pytest.raises(TypeError):
                 Graph(
                     description="test",
                     time_units="generations",
                     doi=[doi],
                 )
 
-        with self.assertRaises(ValueError):
+        with pytest.raises(ValueError):
             Graph(
                 description="test",
                 time_units="generations",
@@ -1852,11 +1604,10 @@ class TestGraph(unittest.TestCase):
     def check_in_generations(self, dg1):
         assert dg1.generation_time is not None
         assert dg1.generation_time > 1
-        dg1_copy = copy.deepcopy(dg1)
+        dg1_asdict = dg1.asdict()
         dg2 = dg1.in_generations()
         # in_generations() shouldn't modify the original
-        dg1_copy.assert_close(dg1)
-        self.assertEqual(dg1.asdict(), dg1_copy.asdict())
+        self.assertEqual(dg1.asdict(), dg1_asdict)
         # but clearly dg2 should now differ
         assert not dg1.isclose(dg2)
         self.assertNotEqual(dg1.asdict(), dg2.asdict())
@@ -1869,14 +1620,13 @@ class TestGraph(unittest.TestCase):
             if dg.time_units == "generations":
                 return dg
             dg.time_units = "generations"
+            # The classes that hold times, or objects that hold times.
+            time_bearing_types = (Graph, Deme, Epoch, AsymmetricMigration, Pulse)
 
             def divide_time_attrs(obj):
-                attribs = getattr(obj, "__slots__", None)
-                if attribs is None:
-                    if not hasattr(obj, "__dict__"):
-                        return
-                    attribs = vars(obj).keys()
-                for attr in attribs:
+                if not isinstance(obj, time_bearing_types):
+                    return
+                for attr in obj.__slots__:
                     value = getattr(obj, attr)
                     if attr in ("time", "start_time", "end_time"):
                         if value is not None:
@@ -1890,12 +1640,12 @@ class TestGraph(unittest.TestCase):
             divide_time_attrs(dg)
             return dg
 
-        dg2.assert_close(in_generations2(dg1))
-        self.assertEqual(in_generations2(dg1).asdict(), dg2.asdict())
+        dg2_alt = in_generations2(dg1)
+        dg2.assert_close(dg2_alt)
+        self.assertEqual(dg2_alt.asdict(), dg2.asdict())
 
         # in_generations2() shouldn't modify the original
-        dg1.assert_close(dg1_copy)
-        self.assertEqual(dg1.asdict(), dg1_copy.asdict())
+        self.assertEqual(dg1.asdict(), dg1_asdict)
 
         # in_generations() should be idempotent
         dg3 = dg2.in_generations()
@@ -1934,7 +1684,7 @@ class TestGraph(unittest.TestCase):
         b1.add_deme("d1", epochs=[dict(start_size=1000, end_time=0)])
         g1 = b1.resolve()
         self.assertTrue(g1.isclose(g1))
-        self.assertTrue(g1.isclose(demes.loads(demes.dumps(g1))))
+        self.assertTrue(g1.isclose(copy.deepcopy(g1)))
 
         # Don't care about description for equality.
         b3 = Builder(description="some other description", time_units="generations")
@@ -2003,6 +1753,11 @@ class TestGraph(unittest.TestCase):
         # Check inequalities
         #
 
+        # Many of the checks below start from the same pair of demes.
+        b_two_demes = copy.deepcopy(b2)
+        b_two_demes.add_deme("d1", epochs=[dict(start_size=1000, end_time=0)])
+        b_two_demes.add_deme("d2", epochs=[dict(start_size=1000, end_time=0)])
+
         b3 = copy.deepcopy(b2)
         b3.add_deme("dX", epochs=[dict(start_size=1000, end_time=0)])
         g3 = b3.resolve()
@@ -2013,9 +1768,7 @@ class TestGraph(unittest.TestCase):
         g3 = b3.resolve()
         self.assertFalse(g1.isclose(g3))
 
-        b3 = copy.deepcopy(b2)
-        b3.add_deme("d1", epochs=[dict(start_size=1000, end_time=0)])
-        b3.add_deme("d2", epochs=[dict(start_size=1000, end_time=0)])
+        b3 = copy.deepcopy(b_two_demes)
         g3 = b3.resolve()
         self.assertFalse(g1.isclose(g3))
 
@@ -2039,59 +1792,39 @@ class TestGraph(unittest.TestCase):
         g4 = b4.resolve()
         self.assertFalse(g3.isclose(g4))
 
-        b3 = copy.deepcopy(b2)
-        b3.add_deme("d1", epochs=[dict(start_size=1000, end_time=0)])
-        b3.add_deme("d2", epochs=[dict(start_size=1000, end_time=0)])
-        b4 = copy.deepcopy(b2)
-        b4.add_deme("d1", epochs=[dict(start_size=1000, end_time=0)])
-        b4.add_deme("d2", epochs=[dict(start_size=1000, end_time=0)])
+        b3 = copy.deepcopy(b_two_demes)
+        b4 = copy.deepcopy(b_two_demes)
         b4.add_migration(source="d2", dest="d1", rate=1e-5)
         g3 = b3.resolve()
         g4 = b4.resolve()
         self.assertFalse(g3.isclose(g4))
 
-        b3 = copy.deepcopy(b2)
-        b3.add_deme("d1", epochs=[dict(start_size=1000, end_time=0)])
-        b3.add_deme("d2", epochs=[dict(start_size=1000, end_time=0)])
+        b3 = copy.deepcopy(b_two_demes)
         b3.add_migration(source="d1", dest="d2", rate=1e-5)
-        b4 = copy.deepcopy(b2)
-        b4.add_deme("d1", epochs=[dict(start_size=1000, end_time=0)])
-        b4.add_deme("d2", epochs=[dict(start_size=1000, end_time=0)])
+        b4 = copy.deepcopy(b_two_demes)
         b4.add_migration(source="d2", dest="d1", rate=1e-5)
         g3 = b3.resolve()
         g4 = b4.resolve()
         self.assertFalse(g3.isclose(g4))
 
-        b3 = copy.deepcopy(b2)
-        b3.add_deme("d1", epochs=[dict(start_size=1000, end_time=0)])
-        b3.add_deme("d2", epochs=[dict(start_size=1000, end_time=0)])
+        b3 = copy.deepcopy(b_two_demes)
         b3.add_migration(source="d2", dest="d1", rate=1e-5)
-        b4 = copy.deepcopy(b2)
-        b4.add_deme("d1", epochs=[dict(start_size=1000, end_time=0)])
-        b4.add_deme("d2", epochs=[dict(start_size=1000, end_time=0)])
+        b4 = copy.deepcopy(b_two_demes)
         b4.add_migration(demes=["d2", "d1"], rate=1e-5)
         g3 = b3.resolve()
         g4 = b4.resolve()
         self.assertFalse(g3.isclose(g4))
 
-        b3 = copy.deepcopy(b2)
-        b3.add_deme("d1", epochs=[dict(start_size=1000, end_time=0)])
-        b3.add_deme("d2", epochs=[dict(start_size=1000, end_time=0)])
-        b4 = copy.deepcopy(b2)
-        b4.add_deme("d1", epochs=[dict(start_size=1000, end_time=0)])
-        b4.add_deme("d2", epochs=[dict(start_size=1000, end_time=0)])
+        b3 = copy.deepcopy(b_two_demes)
+        b4 = copy.deepcopy(b_two_demes)
         b4.add_pulse(source="d1", dest="d2", proportion=0.01, time=100)
         g3 = b3.resolve()
         g4 = b4.resolve()
         self.assertFalse(g3.isclose(g4))
 
-        b3 = copy.deepcopy(b2)
-        b3.add_deme("d1", epochs=[dict(start_size=1000, end_time=0)])
-        b3.add_deme("d2", epochs=[dict(start_size=1000, end_time=0)])
+        b3 = copy.deepcopy(b_two_demes)
         b3.add_pulse(source="d2", dest="d1", proportion=0.01, time=100)
-        b4 = copy.deepcopy(b2)
-        b4.add_deme("d1", epochs=[dict(start_size=1000, end_time=0)])
-        b4.add_deme("d2", epochs=[dict(start_size=1000, end_time=0)])
+        b4 = copy.deepcopy(b_two_demes)
         b4.add_pulse(source="d1", dest="d2", proportion=0.01, time=100)
         g3 = b3.resolve()
         g4 = b4.resolve()
@@ -2504,13 +2237,13 @@ class TestGraphResolution(unittest.TestCase):
         # no epochs given
         b = Builder()
         b.add_deme("a")
-        with self.assertRaises(KeyError):
+        with pytest.raises(KeyError):
             b.resolve()
 
         # missing start_size or end_size
         b = Builder()
         b.add_deme("a", epochs=[dict(end_time=1)])
-        with self.assertRaises(KeyError):
+        with pytest.raises(KeyError):
             b.resolve()
 
         # ancestors must be a list
@@ -2522,7 +2255,7 @@ class TestGraphResolution(unittest.TestCase):
             start_time=10,
             epochs=[dict(start_size=1)],
         )
-        with self.assertRaises(TypeError):
+        with pytest.raises(TypeError):
             b.resolve()
 
         # ancestor x doesn't exist
@@ -2534,14 +2267,14 @@ class TestGraphResolution(unittest.TestCase):
             proportions=[0.5, 0.5],
             epochs=[dict(start_size=1)],
         )
-        with self.assertRaises(ValueError):
+        with pytest.raises(ValueError):
             b.resolve()
 
     def test_duplicate_deme(self):
         b = Builder()
         b.add_deme("a", epochs=[dict(start_size=1)])
         b.add_deme("a", epochs=[dict(start_size=1)])
-        with self.assertRaises(ValueError):
+        with pytest.raises(ValueError):
             b.resolve()
 
     def test_duplicate_ancestors(self):
@@ -2554,83 +2287,9 @@ class TestGraphResolution(unittest.TestCase):
             start_time=100,
             epochs=[dict(start_size=100)],
         )
-        with self.assertRaises(ValueError):
+        with pytest.raises(ValueError):
             b.resolve()
 
-    def test_bad_start_time_wrt_ancestors(self):
-        b1 = Builder()
-        b1.add_deme("ancestral", epochs=[dict(start_size=100)])
-        b1.add_deme(
-            "a",
-            start_time=100,
-            ancestors=["ancestral"],
-            epochs=[dict(start_size=100, end_time=50)],
-        )
-        b1.add_deme("b", epochs=[dict(start_size=100)])
-
-        # start_time too old
-        b2 = copy.deepcopy(b1)
-        b2.add_deme(
-            "c",
-            ancestors=["a"],
-            start_time=200,
-            epochs=[dict(start_size=100)],
-        )
-        with self.assertRaises(ValueError):
-            b2.resolve()
-
-        # start_time too young
-        b2 = copy.deepcopy(b1)
-        b2.add_deme(
-            "c",
-            ancestors=["a"],
-            start_time=20,
-            epochs=[dict(start_size=100)],
-        )
-        with self.assertRaises(ValueError):
-            b2.resolve()
-
-        # start_time too old
-        b2 = copy.deepcopy(b1)
-        b2.add_deme(
-            "c",
-            ancestors=["a", "b"],
-            proportions=[0.5, 0.5],
-            start_time=200,
-            epochs=[dict(start_size=100)],
-        )
-        with self.assertRaises(ValueError):
-            b2.resolve()
-
-        # start_time too young
-        b2 = copy.deepcopy(b1)
-        b2.add_deme(
-            "c",
-            ancestors=["a", "b"],
-            proportions=[0.5, 0.5],
-            start_time=20,
-            epochs=[dict(start_size=100)],
-        )
-        with self.assertRaises(ValueError):
-            b2.resolve()
-
-        # start_time not provided
-        b2 = copy.deepcopy(b1)
-        b2.add_deme(
-            "c",
-            ancestors=["a", "b"],
-            proportions=[0.5, 0.5],
-            epochs=[dict(start_size=100)],
-        )
-        with self.assertRaises(ValueError):
-            b2.resolve()
-
-        # finite start time, but no ancestors
-        b2 = copy.deepcopy(b1)
-        b2.add_deme("c", start_time=100, epochs=[dict(start_size=100)])
-        with self.assertRaises(ValueError):
-            b2.resolve()
-
     def test_proportions(self):
         b1 = Builder()
         b1.add_deme("a", epochs=[dict(start_size=100, end_time=50)])
@@ -2644,7 +2303,7 @@ class TestGraphResolution(unittest.TestCase):
             start_time=100,
             epochs=[dict(start_size=100)],
         )
-        with self.assertRaises(ValueError):
+        with pytest.raises(ValueError):
             b2.resolve()
 
         b2 = copy.deepcopy(b1)
@@ -2656,7 +2315,7 @@ class TestGraphResolution(unittest.TestCase):
             start_time=100,
             epochs=[dict(start_size=100)],
         )
-        with self.assertRaises(ValueError):
+        with pytest.raises(ValueError):
             b2.resolve()
 
         b2 = copy.deepcopy(b1)
@@ -2668,7 +2327,7 @@ class TestGraphResolution(unittest.TestCase):
             start_time=100,
             epochs=[dict(start_size=100)],
         )
-        with self.assertRaises(ValueError):
+        with pytest.raises(ValueError):
             b2.resolve()
 
         b2 = copy.deepcopy(b1)
@@ -2695,7 +2354,7 @@ class TestGraphResolution(unittest.TestCase):
             ancestors=["a"],
             epochs=[dict(start_size=100, end_time=100)],
         )
-        with self.assertRaises(ValueError):
+        with pytest.raises(ValueError):
             b2.resolve()
 
         # can't have epoch end_time > deme start_time
@@ -2706,7 +2365,7 @@ class TestGraphResolution(unittest.TestCase):
             ancestors=["a"],
             epochs=[dict(start_size=100, end_time=200)],
         )
-        with self.assertRaises(ValueError):
+        with pytest.raises(ValueError):
             b2.resolve()
 
         # Check that end_time can be ommitted for final epoch
@@ -2753,13 +2412,13 @@ class TestGraphResolution(unittest.TestCase):
                 dict(start_size=1, end_time=100),
             ],
         )
-        with self.assertRaises(ValueError):
+        with pytest.raises(ValueError):
             b.resolve()
 
         # must have a start_size or end_size
         b = Builder()
         b.add_deme("a", epochs=[dict(end_time=0)])
-        with self.assertRaises(KeyError):
+        with pytest.raises(KeyError):
             b.resolve()
 
         # except for the last epoch, all epochs must have an end_time
@@ -2772,12 +2431,12 @@ class TestGraphResolution(unittest.TestCase):
                 dict(start_size=1, end_time=0),
             ],
         )
-        with self.assertRaises(KeyError):
+        with pytest.raises(KeyError):
             b.resolve()
 
         b = Builder()
         b.add_deme("a", epochs=[dict(start_size=10), dict(end_time=0, start_size=100)])
-        with self.assertRaises(KeyError):
+        with pytest.raises(KeyError):
             b.resolve()
 
     def test_bad_migrations(self):
@@ -2831,35 +2490,35 @@ class TestGraphResolution(unittest.TestCase):
         b = Builder()
         b.add_deme("X", epochs=[dict(start_size=100)])
         b.add_migration(demes=[], rate=0)
-        with self.assertRaises(ValueError):
+        with pytest.raises(ValueError):
             b.resolve()
 
         # only one deme participating in migration
         b = Builder()
         b.add_deme("a", epochs=[dict(start_size=100)])
         b.add_migration(demes=["a"], rate=0.1)
-        with self.assertRaises(ValueError):
+        with pytest.raises(ValueError):
             b.resolve()
 
         # source and dest aren't in the graph
         b = Builder()
         b.add_deme("X", epochs=[dict(start_size=100)])
         b.add_migration(source="a", dest="b", rate=0.1)
-        with self.assertRaises(ValueError):
+        with pytest.raises(ValueError):
             b.resolve()
 
         # dest not in graph
         b = Builder()
         b.add_deme("a", epochs=[dict(start_size=100)])
         b.add_migration(source="a", dest="b", rate=0.1)
-        with self.assertRaises(ValueError):
+        with pytest.raises(ValueError):
             b.resolve()
 
         # source not in graph
         b = Builder()
         b.add_deme("a", epochs=[dict(start_size=100)])
         b.add_migration(source="b", dest="a", rate=0.1)
-        with self.assertRaises(ValueError):
+        with pytest.raises(ValueError):
             b.resolve()
 
     def test_bad_migration_time(self):
@@ -2869,7 +2528,7 @@ class TestGraphResolution(unittest.TestCase):
         b.add_migration(
             source="deme1", dest="deme2", rate=0.01, start_time=1000, end_time=0
         )
-        with self.assertRaises(ValueError):
+        with pytest.raises(ValueError):
             b.resolve()
 
     def test_overlapping_migrations(self):
@@ -2880,29 +2539,29 @@ class TestGraphResolution(unittest.TestCase):
 
         b2 = copy.deepcopy(b1)
         b2.add_migration(source="A", dest="B", start_time=10, rate=0.02)
-        with self.assertRaises(ValueError):
+        with pytest.raises(ValueError):
             b2.resolve()
 
         b2 = copy.deepcopy(b1)
         b2.add_migration(demes=["A", "B"], rate=0.02)
-        with self.assertRaises(ValueError):
+        with pytest.raises(ValueError):
             b2.resolve()
 
         b2 = copy.deepcopy(b1)
         b2.add_migration(demes=["A", "B"], rate=0.02, end_time=100)
-        with self.assertRaises(ValueError):
+        with pytest.raises(ValueError):
             b2.resolve()
 
         b2 = copy.deepcopy(b1)
         b2.add_migration(source="B", dest="A", rate=0.03, start_time=100, end_time=10)
         b2.add_migration(source="B", dest="A", rate=0.04, start_time=50)
-        with self.assertRaises(ValueError):
+        with pytest.raises(ValueError):
             b2.resolve()
 
         b2 = copy.deepcopy(b1)
         b2.add_migration(source="B", dest="A", rate=0.03, start_time=5)
         b2.add_migration(source="B", dest="A", rate=0.05, start_time=10)
-        with self.assertRaises(ValueError):
+        with pytest.raises(ValueError):
             b2.resolve()
 
         b2 = copy.deepcopy(b1)
@@ -2968,14 +2627,14 @@ class TestGraphResolution(unittest.TestCase):
         b = Builder()
         b.add_deme("a", epochs=[dict(start_size=100, end_time=0)])
         b.add_pulse(source="a", dest="b", proportion=0.1, time=10)
-        with self.assertRaises(ValueError):
+        with pytest.raises(ValueError):
             b.resolve()
 
         # source not in graph
         b = Builder()
         b.add_deme("a", epochs=[dict(start_size=100, end_time=0)])
         b.add_pulse(source="b", dest="a", proportion=0.1, time=10)
-        with self.assertRaises(ValueError):
+        with pytest.raises(ValueError):
             b.resolve()
 
         for field in ("source", "dest", "time", "proportion"):
@@ -2992,7 +2651,7 @@ class TestGraphResolution(unittest.TestCase):
         b.add_deme("deme1", epochs=[dict(start_size=1000, end_time=0)])
         b.add_deme("deme2", epochs=[dict(end_time=100, start_size=1000)])
         b.add_pulse(source="deme1", dest="deme2", proportion=0.1, time=10)
-        with self.assertRaises(ValueError):
+        with pytest.raises(ValueError):
             b.resolve()
 
         b = Builder(defaults=dict(epoch=dict(start_size=100)))
@@ -3003,13 +2662,13 @@ class TestGraphResolution(unittest.TestCase):
         # Can't have pulse at the dest deme's end_time.
         b2 = copy.deepcopy(b)
         b2.add_pulse(source="A", dest="B", time=g["B"].end_time, proportion=0.1)
-        with self.assertRaises(ValueError):
+        with pytest.raises(ValueError):
             b2.resolve()
 
         # Can't have pulse at the source deme's start_time.
         b2 = copy.deepcopy(b)
         b2.add_pulse(source="B", dest="A", time=g["B"].start_time, proportion=0.1)
-        with self.assertRaises(ValueError):
+        with pytest.raises(ValueError):
             b2.resolve()
 
     def test_pulse_same_time(self):
@@ -3728,7 +3387,46 @@ class TestGraphResolution(unittest.TestCase):
         assert g["A"].epochs[1].size_function == "exponential"
 
 
-class TestGraphToDict(unittest.TestCase):
+@pytest.fixture
+def builder_with_ancestors():
+    # Deme "a" exists from 100 to 50 generations ago, while "ancestral"
+    # and "b" exist for all time.
+    b = Builder()
+    b.add_deme("ancestral", epochs=[dict(start_size=100)])
+    b.add_deme(
+        "a",
+        start_time=100,
+        ancestors=["ancestral"],
+        epochs=[dict(start_size=100, end_time=50)],
+    )
+    b.add_deme("b", epochs=[dict(start_size=100)])
+    return b
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        # start_time too old
+        dict(ancestors=["a"], start_time=200),
+        # start_time too young
+        dict(ancestors=["a"], start_time=20),
+        # start_time too old
+        dict(ancestors=["a", "b"], proportions=[0.5, 0.5], start_time=200),
+        # start_time too young
+        dict(ancestors=["a", "b"], proportions=[0.5, 0.5], start_time=20),
+        # start_time not provided
+        dict(ancestors=["a", "b"], proportions=[0.5, 0.5]),
+        # finite start time, but no ancestors
+        dict(start_time=100),
+    ],
+)
+def test_bad_start_time_wrt_ancestors(builder_with_ancestors, kwargs):
+    builder_with_ancestors.add_deme("c", epochs=[dict(start_size=100)], **kwargs)
+    with pytest.raises(ValueError):
+        builder_with_ancestors.resolve()
+
+
+class TestGraphToDict:
     def test_finite_start_time(self):
         b = Builder()
         b.add_deme("ancestral", epochs=[dict(start_size=100)])
@@ -3740,25 +3438,26 @@ class TestGraphToDict(unittest.TestCase):
         )
         g = b.resolve()
         d = g.asdict()
-        self.assertTrue(d["demes"][1]["start_time"] == g["a"].start_time == 100)
+        assert d["demes"][1]["start_time"] == g["a"].start_time == 100
 
     def test_deme_selfing_rate(self):
         b = Builder()
         b.add_deme("a", epochs=[dict(start_size=100, selfing_rate=0.1)])
         d = b.resolve().asdict()
-        self.assertTrue(d["demes"][0]["epochs"][0]["selfing_rate"] == 0.1)
+        assert d["demes"][0]["epochs"][0]["selfing_rate"] == 0.1
 
     def test_deme_cloning_rate(self):
         b = Builder()
         b.add_deme("a", epochs=[dict(start_size=100, cloning_rate=0.1)])
-        d = b.resolve().asdict()
-        self.assertTrue(d["demes"][0]["epochs"][0]["cloning_rate"] == 0.1)
-        d = b.resolve().asdict_simplified()
-        self.assertTrue(d["demes"][0]["epochs"][0]["cloning_rate"] == 0.1)
+        g = b.resolve()
+        d = g.asdict()
+        assert d["demes"][0]["epochs"][0]["cloning_rate"] == 0.1
+        d = g.asdict_simplified()
+        assert d["demes"][0]["epochs"][0]["cloning_rate"] == 0.1
 
         b.add_deme("b", epochs=[dict(start_size=200, end_time=0)])
         d = b.resolve().asdict_simplified()
-        self.assertTrue("cloning_rate" not in d["demes"][1])
+        assert "cloning_rate" not in d["demes"][1]
 
         b.add_deme(
             "c",
@@ -3768,8 +3467,8 @@ class TestGraphToDict(unittest.TestCase):
             ],
         )
         d = b.resolve().asdict_simplified()
-        self.assertTrue(d["demes"][2]["epochs"][0]["cloning_rate"] == 0.3)
-        self.assertTrue("cloning_rate" not in d["demes"][2]["epochs"][1], msg=f"{d}")
+        assert d["demes"][2]["epochs"][0]["cloning_rate"] == 0.3
+        assert "cloning_rate" not in d["demes"][2]["epochs"][1], f"{d}"
 
     def test_fill_epoch_selfing_rates(self):
         b = Builder()
@@ -3782,8 +3481,8 @@ class TestGraphToDict(unittest.TestCase):
             ],
         )
         d = b.resolve().asdict()
-        self.assertTrue(d["demes"][0]["epochs"][0]["selfing_rate"] == 0.2)
-        self.assertTrue(d["demes"][0]["epochs"][1]["selfing_rate"] == 0.1)
+        assert d["demes"][0]["epochs"][0]["selfing_rate"] == 0.2
+        assert d["demes"][0]["epochs"][1]["selfing_rate"] == 0.1
 
         b = Builder()
         b.add_deme(
@@ -3794,8 +3493,8 @@ class TestGraphToDict(unittest.TestCase):
             ],
         )
         d = b.resolve().asdict_simplified()
-        self.assertTrue("selfing_rate" not in d["demes"][0]["epochs"][0])
-        self.assertTrue(d["demes"][0]["epochs"][1]["selfing_rate"] == 0.1)
+        assert "selfing_rate" not in d["demes"][0]["epochs"][0]
+        assert d["demes"][0]["epochs"][1]["selfing_rate"] == 0.1
 
     def test_fill_epoch_cloning_rates(self):
         b = Builder()
@@ -3808,8 +3507,8 @@ class TestGraphToDict(unittest.TestCase):
             ],
         )
         d = b.resolve().asdict()
-        self.assertTrue(d["demes"][0]["epochs"][0]["cloning_rate"] == 0.2)
-        self.assertTrue(d["demes"][0]["epochs"][1]["cloning_rate"] == 0.1)
+        assert d["demes"][0]["epochs"][0]["cloning_rate"] == 0.2
+        assert d["demes"][0]["epochs"][1]["cloning_rate"] == 0.1
 
         b = Builder()
         b.add_deme(
@@ -3820,15 +3519,15 @@ class TestGraphToDict(unittest.TestCase):
             ],
         )
         d = b.resolve().asdict()
-        self.assertTrue(d["demes"][0]["epochs"][1]["cloning_rate"] == 0.1)
+        assert d["demes"][0]["epochs"][1]["cloning_rate"] == 0.1
 
     def test_fill_description(self):
         b = Builder(description="toplevel-description")
         b.add_deme("a", description="deme-description", epochs=[dict(start_size=100)])
         g = b.resolve()
         d = g.asdict()
-        self.assertTrue(d["description"] == g.description)
-        self.assertTrue(d["demes"][0]["description"] == g["a"].description)
+        assert d["description"] == g.description
+        assert d["demes"][0]["description"] == g["a"].description
 
     def test_fill_migration_bounds(self):
         b = Builder()
@@ -3836,8 +3535,8 @@ class TestGraphToDict(unittest.TestCase):
         b.add_deme("b", epochs=[dict(start_size=100, end_time=0)])
         b.add_migration(source="a", dest="b", rate=0.01, start_time=20, end_time=10)
         d = b.resolve().asdict()
-        self.assertTrue(d["migrations"][0]["start_time"] == 20)
-        self.assertTrue(d["migrations"][0]["end_time"] == 10)
+        assert d["migrations"][0]["start_time"] == 20
+        assert d["migrations"][0]["end_time"] == 10
 
     def msorted(self, data):
         # sort migrations' demes list for easier comparison
@@ -4010,7 +3709,6 @@ class TestBuilder:
         assert hasattr(b, "data")
         assert isinstance(b.data, typing.MutableMapping)
 
-    @hyp.settings(deadline=None, suppress_health_check=[hyp.HealthCheck.too_slow])
     @hyp.given(graph=demes.hypothesis_strategies.graphs())
     def test_back_and_forth(self, graph):
         b = Builder.fromdict(graph.asdict())
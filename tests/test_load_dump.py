@@ -1,10 +1,17 @@
+import concurrent.futures
 import copy
 import decimal
 import enum
 import fractions
+import io
+import math
+import os
 import pathlib
+import subprocess
+import sys
 import tempfile
 import textwrap
+import threading
 
 import pytest
 import hypothesis as hyp
@@ -184,6 +191,23 @@ class TestLoadAndDump:
                 with pytest.raises(ValueError):
                     demes.dump(g, tmpfile, format="not a format", simplified=simplified)
 
+    def test_bad_format_param_checked_before_reading(self):
+        # The format is rejected before the file is read,
+        # so we get a ValueError rather than a FileNotFoundError.
+        with tempfile.TemporaryDirectory() as tmpdir:
+            missing = pathlib.Path(tmpdir) / "missing.yml"
+            with pytest.raises(ValueError):
+                demes.load(missing, format="not a format")
+            with pytest.raises(ValueError):
+                demes.load_asdict(missing, format="not a format")
+            with pytest.raises(ValueError):
+                demes.load_many([missing, missing], format="not a format")
+
+    def test_yaml_imported_lazily(self):
+        # Check that importing demes doesn't import the YAML library.
+        code = "import sys, demes; assert 'ruamel.yaml' not in sys.modules"
+        subprocess.run([sys.executable, "-c", code], check=True)
+
     def test_bad_filename_param(self):
         b = demes.Builder()
         b.add_deme("A", epochs=[dict(start_size=1000, end_time=0)])
@@ -312,6 +336,16 @@ class TestLoadAndDump:
             self.check_dump_against_dumps(format="yaml", simplified=simplified)
             self.check_dump_against_dumps(format="json", simplified=simplified)
 
+    def test_dump_overwrites_existing_file(self):
+        g = jacobs_papuans()
+        for format in ["yaml", "json"]:
+            with tempfile.TemporaryDirectory() as tmpdir:
+                tmpfile = pathlib.Path(tmpdir) / "temp.txt"
+                demes.dump(g, tmpfile, format=format, simplified=False)
+                demes.dump(g, tmpfile, format=format)
+                with open(tmpfile) as f:
+                    assert f.read() == demes.dumps(g, format=format)
+
     def test_loads_json_simple(self):
         string = textwrap.dedent(
             """\
@@ -396,6 +430,65 @@ class TestLoadAndDump:
         assert g["C"].ancestors == ["A", "B"]
         assert g["C"].proportions == [0.1, 0.9]
 
+    def test_loads_bytes(self):
+        g1 = jacobs_papuans()
+        for format in ["yaml", "json"]:
+            for simplified in [True, False]:
+                string = demes.dumps(g1, format=format, simplified=simplified)
+                g2 = demes.loads(string.encode("utf-8"), format=format)
+                g1.assert_close(g2)
+
+    def test_loads_repeated(self):
+        g1 = jacobs_papuans()
+        for format in ["yaml", "json"]:
+            string = demes.dumps(g1, format=format)
+            # The first load parses afresh, the second load also populates
+            # the cache, and later loads are built from the cached data.
+            graphs = [demes.loads(string, format=format) for _ in range(4)]
+            for j, g2 in enumerate(graphs):
+                g1.assert_close(g2)
+                # Each call returns a distinct graph.
+                for g3 in graphs[j + 1 :]:
+                    assert g2 is not g3
+                g2.demes[0].epochs[0].start_size += 1
+                g2.demes.pop()
+            g1.assert_close(demes.loads(string, format=format))
+            # The cache doesn't hold on to the document.
+            assert all(
+                type(digest) is bytes and len(digest) < len(string)
+                for digest, _ in demes.load_dump._loads_cache
+            )
+
+    def test_loads_threads(self):
+        g1 = jacobs_papuans()
+        string = demes.dumps(g1)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+            graphs = list(executor.map(lambda _: demes.loads(string), range(16)))
+        for g2 in graphs:
+            g1.assert_close(g2)
+        assert len(demes.load_dump._loads_cache) == 1
+
+    def test_loads_repeated_warns(self):
+        b = demes.Builder()
+        for name in "abc":
+            b.add_deme(name, epochs=[dict(start_size=1)])
+        b.add_pulse(source="a", dest="b", proportion=0.1, time=100)
+        b.add_pulse(source="b", dest="c", proportion=0.1, time=100)
+        with pytest.warns(UserWarning):
+            g = b.resolve()
+        string = demes.dumps(g)
+        for _ in range(3):
+            with pytest.warns(UserWarning):
+                demes.loads(string)
+
+    def test_loads_not_a_mapping(self):
+        for string in ["- time_units: generations", "42", "[]"]:
+            with pytest.raises(TypeError):
+                demes.loads(string)
+        for string in ['[{"time_units": "generations"}]', "42", "[]"]:
+            with pytest.raises(TypeError):
+                demes.loads(string, format="json")
+
     def test_loads_examples(self):
         examples_path = pathlib.Path(__file__).parent.parent / "examples"
         n = 0
@@ -411,6 +504,140 @@ class TestLoadAndDump:
             assert len(g.demes) > 0
         assert n > 1
 
+    def test_load_binary_fileobj(self):
+        g1 = jacobs_papuans()
+        for format in ["yaml", "json"]:
+            with tempfile.TemporaryDirectory() as tmpdir:
+                tmpfile = pathlib.Path(tmpdir) / "temp.txt"
+                demes.dump(g1, tmpfile, format=format)
+                with open(tmpfile, "rb") as f:
+                    g2 = demes.load(f, format=format)
+            g1.assert_close(g2)
+
+    @pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="requires os.mkfifo()")
+    def test_load_fifo(self):
+        examples_path = pathlib.Path(__file__).parent.parent / "examples"
+        yaml_file = examples_path / "zigzag.yml"
+        g1 = demes.load(yaml_file)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fifo = pathlib.Path(tmpdir) / "fifo"
+            os.mkfifo(fifo)
+            # Opening a FIFO blocks until the other end is opened too,
+            # so the writer must run concurrently with the reader.
+            writer = threading.Thread(
+                target=fifo.write_bytes, args=(yaml_file.read_bytes(),)
+            )
+            writer.start()
+            try:
+                g2 = demes.load(fifo)
+            finally:
+                writer.join()
+        g1.assert_close(g2)
+
+    def test_dump_binary_fileobj(self):
+        g1 = jacobs_papuans()
+        for format in ["yaml", "json"]:
+            for simplified in [True, False]:
+                with io.BytesIO() as f:
+                    demes.dump(g1, f, format=format, simplified=simplified)
+                    string = f.getvalue()
+                assert isinstance(string, bytes)
+                assert string.decode("utf-8") == demes.dumps(
+                    g1, format=format, simplified=simplified
+                )
+                g2 = demes.loads(string, format=format)
+                g1.assert_close(g2)
+
+    def test_dump_named_temporary_file(self):
+        g1 = jacobs_papuans()
+        for format in ["yaml", "json"]:
+            for mode in ["w+b", "w+"]:
+                with tempfile.NamedTemporaryFile(mode=mode) as f:
+                    demes.dump(g1, f, format=format)
+                    f.seek(0)
+                    g2 = demes.load(f, format=format)
+                g1.assert_close(g2)
+            with tempfile.SpooledTemporaryFile() as f:
+                demes.dump(g1, f, format=format)
+                f.seek(0)
+                g2 = demes.load(f, format=format)
+            g1.assert_close(g2)
+
+    def test_dump_and_load_zstd(self):
+        pytest.importorskip("zstandard")
+        g1 = jacobs_papuans()
+        for format in ["yaml", "json"]:
+            with tempfile.TemporaryDirectory() as tmpdir:
+                tmpfile = pathlib.Path(tmpdir) / f"temp.{format}.zst"
+                demes.dump(g1, tmpfile, format=format)
+                with open(tmpfile, "rb") as f:
+                    # Zstandard frame magic number.
+                    assert f.read(4) == b"\x28\xb5\x2f\xfd"
+                g2 = demes.load(tmpfile, format=format)
+                g1.assert_close(g2)
+                (g3,) = demes.load_many([str(tmpfile)], format=format)
+                g1.assert_close(g3)
+
+    def test_load_zstd_multiple_frames(self):
+        zstandard = pytest.importorskip("zstandard")
+        g1 = jacobs_papuans()
+        string = demes.dumps(g1).encode()
+        # Split the document over several frames, one of which doesn't
+        # record the decompressed size in its header.
+        i = len(string) // 3
+        cctx = zstandard.ZstdCompressor()
+        cobj = cctx.compressobj()
+        buf = cctx.compress(string[:i]) + cobj.compress(string[i:-i]) + cobj.flush()
+        buf += cctx.compress(string[-i:])
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpfile = pathlib.Path(tmpdir) / "temp.yaml.zst"
+            tmpfile.write_bytes(buf)
+            g2 = demes.load(tmpfile)
+        g1.assert_close(g2)
+
+    def test_zstd_without_zstandard(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, "zstandard", None)
+        g = jacobs_papuans()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpfile = pathlib.Path(tmpdir) / "temp.yaml.zst"
+            with pytest.raises(ImportError, match="zstandard"):
+                demes.dump(g, tmpfile)
+            tmpfile.write_bytes(b"")
+            with pytest.raises(ImportError, match="zstandard"):
+                demes.load(tmpfile)
+
+    def test_load_many(self):
+        examples_path = pathlib.Path(__file__).parent.parent / "examples"
+        yaml_files = sorted(examples_path.glob("*.yml"))
+        assert len(yaml_files) > 1
+        graphs = demes.load_many(yaml_files)
+        assert len(graphs) == len(yaml_files)
+        for yaml_file, g in zip(yaml_files, graphs):
+            assert g.isclose(demes.load(yaml_file))
+
+        for max_workers in [1, 2, len(yaml_files) + 1]:
+            graphs2 = demes.load_many(iter(yaml_files), max_workers=max_workers)
+            assert len(graphs2) == len(graphs)
+            for g1, g2 in zip(graphs, graphs2):
+                g1.assert_close(g2)
+
+        assert demes.load_many([]) == []
+        with pytest.raises(ValueError):
+            demes.load_many(yaml_files, format="not a format")
+        with pytest.raises(ValueError):
+            demes.load_many(yaml_files, max_workers=0)
+
+    def test_load_many_json(self):
+        g1 = jacobs_papuans()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpfile = pathlib.Path(tmpdir) / "temp.json"
+            demes.dump(g1, tmpfile, format="json")
+            with open(tmpfile) as f:
+                graphs = demes.load_many([tmpfile, str(tmpfile), f], format="json")
+        assert len(graphs) == 3
+        for g2 in graphs:
+            g1.assert_close(g2)
+
     def check_dump_and_load_simple(self, *, format, simplified):
         b1 = demes.Builder(
             description="some very concise description",
@@ -444,6 +671,73 @@ class TestLoadAndDump:
             self.check_dump_and_load_simple(format="json", simplified=simplified)
             self.check_dump_and_load_complex(format="json", simplified=simplified)
 
+    def test_dump_and_load_json_without_orjson(self, monkeypatch):
+        monkeypatch.setattr(demes.load_dump, "orjson", None)
+        for simplified in [True, False]:
+            self.check_dump_and_load_complex(format="json", simplified=simplified)
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_dump_json_non_ascii(self, use_orjson, monkeypatch):
+        if not use_orjson:
+            monkeypatch.setattr(demes.load_dump, "orjson", None)
+        b = demes.Builder(description="caf\u00e9 \u2603")
+        b.add_deme("a", epochs=[dict(start_size=1, end_time=0)])
+        b.add_deme("b", ancestors=["a"], start_time=100, epochs=[dict(start_size=1)])
+        g1 = b.resolve()
+        for simplified in [True, False]:
+            string = demes.dumps(g1, format="json", simplified=simplified)
+            assert string.isascii()
+            # JSON output has the same style, with or without infinities.
+            assert ", " not in string
+            assert ": " not in string
+            with io.BytesIO() as buf:
+                with io.TextIOWrapper(buf, encoding="latin-1") as f:
+                    demes.dump(g1, f, format="json", simplified=simplified)
+                    f.flush()
+                    assert buf.getvalue().decode("latin-1") == string
+            g2 = demes.loads(string, format="json")
+            g1.assert_close(g2)
+            assert g2.description == g1.description
+
+    def check_dump_yaml_fast(self, data, monkeypatch):
+        with io.StringIO() as f:
+            assert demes.load_dump._dump_yaml_fromdict_fast(data, f)
+            fast = f.getvalue()
+        with io.BytesIO() as f:
+            assert demes.load_dump._dump_yaml_fromdict_fast(data, f)
+            assert f.getvalue() == fast.encode("utf-8")
+        with monkeypatch.context() as m:
+            m.setattr(demes.load_dump, "_dump_yaml_fromdict_fast", lambda *args: False)
+            with io.StringIO() as f:
+                demes.load_dump._dump_yaml_fromdict(data, f)
+                generic = f.getvalue()
+        assert fast == generic
+
+    def test_dump_yaml_fast(self, monkeypatch):
+        pytest.importorskip("ruamel.yaml.cyaml")
+        examples_path = pathlib.Path(__file__).parent.parent / "examples"
+        for yaml_file in examples_path.glob("*.yml"):
+            g = demes.load(yaml_file)
+            self.check_dump_yaml_fast(g.asdict(), monkeypatch)
+            self.check_dump_yaml_fast(g.asdict_simplified(), monkeypatch)
+
+        strings = ["", "1", "1.0", "1e3", ".inf", "null", "~", "true", "False"]
+        strings += ["x: y", "- x", "#x", "'x'", '"x"', "x\ny", " x", "\u00e9"]
+        strings += ["very long string " * 10, "https://doi.org/10.1000/xyz123"]
+        data = dict(
+            strings=strings,
+            strings_block=[dict(x=string) for string in strings],
+            numbers=[0, -1, 2 << 70, 0.0, -0.5, 1e-20, 1e300, math.inf, -math.inf],
+            nested=dict(a=[], b={}, c=[[1, 2], dict(d=[3])]),
+        )
+        self.check_dump_yaml_fast(data, monkeypatch)
+
+    def test_dump_yaml_fast_unsupported_types(self):
+        for data in [dict(a=True), dict(a=None), dict(a=(1, 2)), dict(a=np.int32(1))]:
+            with io.StringIO() as f:
+                assert not demes.load_dump._dump_yaml_fromdict_fast(data, f)
+                assert f.getvalue() == ""
+
     def check_examples_load_dump_load(self, *, format, simplified):
         examples_path = pathlib.Path(__file__).parent.parent / "examples"
         n = 0
@@ -508,7 +802,6 @@ class TestLoadAndDump:
                     if format == "yaml":
                         self.check_yaml_output_is_pretty(g, tmpfile, simplified)
 
-    @hyp.settings(deadline=None, suppress_health_check=[hyp.HealthCheck.too_slow])
     @hyp.given(g=demes.hypothesis_strategies.graphs())
     def test_dump_load(self, g):
         self.check_dump_load_roundtrip(g)